@@ -0,0 +1,35 @@
+"""JSON encoding helpers backed by orjson when available"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses the stdlib error, so callers can catch this
+JSONDecodeError = json.JSONDecodeError
+
+
+if ORJSON_AVAILABLE:
+    def dumps(obj: Any, indent: bool = True) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes"""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from a str or bytes object"""
+        return orjson.loads(data)
+
+else:
+    def dumps(obj: Any, indent: bool = True) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes"""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from a str or bytes object"""
+        return json.loads(data)
@@ -0,0 +1,26 @@
+"""Cheap unique IDs for model objects"""
+
+import itertools
+import os
+from uuid import UUID
+
+# Random per-process prefix combined with a counter, so only process start
+# (and fork) pays for urandom instead of every new object
+_prefix = os.urandom(8)
+_counter = itertools.count()
+
+
+def _reseed() -> None:
+    """Draw a fresh prefix so forked children never reuse the parent's IDs"""
+    global _prefix, _counter
+    _prefix = os.urandom(8)
+    _counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def new_id() -> UUID:
+    """Return a new UUID (version 4 layout) unique within this process"""
+    return UUID(bytes=_prefix + next(_counter).to_bytes(8, "big"), version=4)
@@ -1,8 +1,12 @@
+import sys
 from enum import Enum
-from uuid import UUID, uuid4
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from uuid import UUID
+from typing import Dict, Any, Mapping, Optional, Tuple
 from datetime import datetime
 
+from ._ids import new_id
+
 
 class EffectType(Enum):
     BOOST = "BOOST"
@@ -14,6 +18,8 @@ class EffectType(Enum):
 class AudioEffect:
     """Individual processing unit with configurable parameters"""
 
+    __slots__ = ("id", "type", "_bypassed", "_owner", "position", "preset_name", "parameters")
+
     # Parameter definitions for each effect type
     PARAMETER_DEFINITIONS = {
         EffectType.BOOST: {
@@ -49,37 +55,47 @@ class AudioEffect:
         if not isinstance(effect_type, EffectType):
             raise ValueError(f"Invalid effect type: {effect_type}")
 
-        self.id = uuid4()
+        self.id = new_id()
         self.type = effect_type
-        self.bypassed = False
+        self._owner = None  # Chain notified of bypass changes
+        self._bypassed = False
         self.position = 0
         self.preset_name: Optional[str] = None
 
-        # Initialize parameters with defaults
+        # Initialize parameters with defaults. Keys always come from the
+        # interned schema names; later updates only replace values, so names
+        # parsed from JSON are never retained as keys.
         self.parameters = {}
-        param_defs = self.PARAMETER_DEFINITIONS[effect_type]
-
-        for param_name, param_def in param_defs.items():
-            self.parameters[param_name] = param_def["default"]
+        for param_name, _min_val, _max_val, default, _is_bool in _PARAM_SCHEMA[effect_type]:
+            self.parameters[param_name] = default
 
         # Apply custom parameters if provided
         if parameters:
             self.update_parameters(parameters)
 
     def update_parameters(self, new_parameters: Dict[str, Any]) -> None:
-        """Update effect parameters with validation"""
-        param_defs = self.PARAMETER_DEFINITIONS[self.type]
+        """Update effect parameters with validation
+
+        All values are validated before any are applied, so a rejected update
+        leaves the effect unchanged.
+        """
+        param_ranges = _PARAM_RANGES[self.type]
+        current_parameters = self.parameters
+        validated = {}
 
         for param_name, param_value in new_parameters.items():
-            if param_name not in param_defs:
+            # Unchanged values were validated when set; skip them
+            if current_parameters.get(param_name, _MISSING) == param_value:
+                continue
+
+            param_range = param_ranges.get(param_name)
+            if param_range is None:
                 raise ValueError(f"Unknown parameter '{param_name}' for effect type {self.type.value}")
 
-            param_def = param_defs[param_name]
-            min_val = param_def["min"]
-            max_val = param_def["max"]
+            min_val, max_val, is_bool = param_range
 
             # Special handling for boolean parameters
-            if param_def["units"] == "bool":
+            if is_bool:
                 if param_value not in [True, False, 0, 1]:
                     raise ValueError(f"{param_name} must be a boolean value")
                 param_value = bool(param_value)
@@ -87,33 +103,40 @@ class AudioEffect:
                 if not isinstance(param_value, (int, float)):
                     raise ValueError(f"{param_name} must be a numeric value")
 
-                if param_value < min_val or param_value > max_val:
+                if not min_val <= param_value <= max_val:
                     raise ValueError(f"{param_name} must be between {min_val} and {max_val}")
 
-            self.parameters[param_name] = param_value
+            validated[param_name] = param_value
+
+        if validated:
+            current_parameters.update(validated)
 
     def get_parameter_info(self, param_name: str) -> Dict[str, Any]:
         """Get parameter metadata including value, range, and units"""
         if param_name not in self.parameters:
             raise ValueError(f"Parameter '{param_name}' not found")
 
-        param_def = self.PARAMETER_DEFINITIONS[self.type][param_name]
+        return {"value": self.parameters[param_name], **_STATIC_INFO[self.type][param_name]}
 
+    def get_all_parameter_info(self) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for all parameters"""
+        static_info = _STATIC_INFO[self.type]
         return {
-            "value": self.parameters[param_name],
-            "min_value": param_def["min"],
-            "max_value": param_def["max"],
-            "default_value": param_def["default"],
-            "units": param_def["units"],
-            "curve_type": param_def["curve"]
+            param_name: {"value": value, **static_info[param_name]}
+            for param_name, value in self.parameters.items()
         }
 
-    def get_all_parameter_info(self) -> Dict[str, Dict[str, Any]]:
-        """Get metadata for all parameters"""
-        result = {}
-        for param_name in self.parameters.keys():
-            result[param_name] = self.get_parameter_info(param_name)
-        return result
+    @property
+    def bypassed(self) -> bool:
+        """Whether the effect is bypassed"""
+        return self._bypassed
+
+    @bypassed.setter
+    def bypassed(self, bypassed: bool) -> None:
+        owner = self._owner
+        if owner is not None and bypassed != self._bypassed:
+            owner._bypass_changed()
+        self._bypassed = bypassed
 
     def set_bypassed(self, bypassed: bool) -> None:
         """Set effect bypass state"""
@@ -129,12 +152,16 @@ class AudioEffect:
         """Set preset name for effect"""
         self.preset_name = preset_name
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert effect to dictionary for serialization"""
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Convert effect to dictionary for serialization
+
+        With copy=False the parameters dict is shared with the effect, for
+        read-only consumers such as JSON encoding.
+        """
         return {
             "id": str(self.id),
             "type": self.type.value,
-            "parameters": self.parameters.copy(),
+            "parameters": self.parameters.copy() if copy else self.parameters,
             "bypassed": self.bypassed,
             "position": self.position,
             "preset_name": self.preset_name
@@ -154,11 +181,36 @@ class AudioEffect:
 
         return effect
 
+    @classmethod
+    def _from_trusted_dict(cls, data: Dict[str, Any]) -> 'AudioEffect':
+        """Create effect from to_dict output without re-validating parameters"""
+        effect = cls.__new__(cls)
+        effect.id = UUID(data["id"]) if "id" in data else new_id()
+        effect.type = EffectType(data["type"])
+        effect._owner = None
+        effect._bypassed = data.get("bypassed", False)
+        effect.position = data.get("position", 0)
+        effect.preset_name = data.get("preset_name")
+
+        # Only schema names are kept, so keys stay interned and unknown ones are dropped
+        parameters = data.get("parameters", {})
+        effect.parameters = {}
+        for param_name, _min_val, _max_val, default, _is_bool in _PARAM_SCHEMA[effect.type]:
+            effect.parameters[param_name] = parameters.get(param_name, default)
+
+        return effect
+
     def copy(self) -> 'AudioEffect':
         """Create a copy of this effect with new ID"""
-        effect_dict = self.to_dict()
-        new_effect = self.from_dict(effect_dict)
-        new_effect.id = uuid4()  # Generate new ID for copy
+        # Parameters are already validated, so clone slots directly
+        new_effect = self.__class__.__new__(self.__class__)
+        new_effect.id = new_id()  # Generate new ID for copy
+        new_effect.type = self.type
+        new_effect._owner = None
+        new_effect._bypassed = self._bypassed
+        new_effect.position = self.position
+        new_effect.preset_name = self.preset_name
+        new_effect.parameters = self.parameters.copy()
         return new_effect
 
     def __eq__(self, other) -> bool:
@@ -168,4 +220,39 @@ class AudioEffect:
         return self.id == other.id
 
     def __repr__(self) -> str:
-        return f"AudioEffect(type={self.type.value}, id={self.id}, bypassed={self.bypassed})"
\ No newline at end of file
+        return f"AudioEffect(type={self.type.value}, id={self.id}, bypassed={self.bypassed})"
+
+
+# Sentinel for parameter lookups, distinct from any valid value
+_MISSING = object()
+
+# Flattened (name, min, max, default, is_bool) schema per effect type, built once
+# from PARAMETER_DEFINITIONS so construction avoids nested dict lookups
+_PARAM_SCHEMA: Dict[EffectType, Tuple[Tuple[str, float, float, Any, bool], ...]] = {
+    effect_type: tuple(
+        (sys.intern(name), param_def["min"], param_def["max"], param_def["default"], param_def["units"] == "bool")
+        for name, param_def in param_defs.items()
+    )
+    for effect_type, param_defs in AudioEffect.PARAMETER_DEFINITIONS.items()
+}
+
+# Per-type {name: (min, max, is_bool)} view used for parameter validation
+_PARAM_RANGES: Dict[EffectType, Dict[str, Tuple[float, float, bool]]] = {
+    effect_type: {name: (min_val, max_val, is_bool) for name, min_val, max_val, _default, is_bool in schema}
+    for effect_type, schema in _PARAM_SCHEMA.items()
+}
+
+# Read-only parameter metadata per type; only the current value is overlaid per call
+_STATIC_INFO: Dict[EffectType, Dict[str, Mapping[str, Any]]] = {
+    effect_type: {
+        name: MappingProxyType({
+            "min_value": param_def["min"],
+            "max_value": param_def["max"],
+            "default_value": param_def["default"],
+            "units": param_def["units"],
+            "curve_type": param_def["curve"]
+        })
+        for name, param_def in param_defs.items()
+    }
+    for effect_type, param_defs in AudioEffect.PARAMETER_DEFINITIONS.items()
+}
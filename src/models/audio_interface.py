@@ -1,18 +1,28 @@
-from uuid import UUID, uuid4
-from typing import List, Optional, Dict, Any
+from uuid import UUID
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+from ._ids import new_id
 
-@dataclass
+
+# Shared sample rate tuples, since most devices report one of a few rate sets
+_SAMPLE_RATE_TUPLES: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class AudioDeviceInfo:
     """Information about an audio device"""
     name: str
     max_input_channels: int
     max_output_channels: int
-    supported_sample_rates: List[int]
+    supported_sample_rates: Tuple[int, ...]
     default_sample_rate: int
     device_index: int
 
+    def __post_init__(self) -> None:
+        rates = tuple(self.supported_sample_rates)
+        object.__setattr__(self, "supported_sample_rates", _SAMPLE_RATE_TUPLES.setdefault(rates, rates))
+
 
 class AudioInterface:
     """Represents audio hardware connection and configuration"""
@@ -27,19 +37,22 @@ class AudioInterface:
         sample_rate: int = 48000,
         buffer_size: int = 256
     ):
-        self.id = uuid4()
+        self.id = new_id()
         self.input_device_name = input_device_name
         self.output_device_name = output_device_name
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
-        self.input_channels: List[int] = [0]  # Default to first channel
-        self.output_channels: List[int] = [0, 1]  # Default to stereo
+        # Channels are stored as tuples and converted to lists at API boundaries
+        self.input_channels: Tuple[int, ...] = (0,)  # Default to first channel
+        self.output_channels: Tuple[int, ...] = (0, 1)  # Default to stereo
         self.latency_ms: Optional[float] = None
 
         # Validate configuration
         self._validate_sample_rate()
         self._validate_buffer_size()
 
+        self._update_derived_timing()
+
     def _validate_sample_rate(self) -> None:
         """Validate sample rate"""
         if self.sample_rate not in self.SUPPORTED_SAMPLE_RATES:
@@ -50,33 +63,42 @@ class AudioInterface:
         if self.buffer_size not in self.VALID_BUFFER_SIZES:
             raise ValueError(f"Buffer size must be one of {self.VALID_BUFFER_SIZES}")
 
+    def _update_derived_timing(self) -> None:
+        """Recompute values derived from buffer size and sample rate"""
+        self._theoretical_latency_ms = (self.buffer_size / self.sample_rate) * 1000
+        self._low_latency = self._theoretical_latency_ms <= 10.0  # < 10ms for guitar processing
+        # Buffer size must be reasonable and sample rate suitable for real-time processing
+        self._real_time_capable = self.buffer_size <= 1024 and self.sample_rate >= 44100
+
     def set_sample_rate(self, sample_rate: int) -> None:
         """Set audio sample rate"""
         if sample_rate not in self.SUPPORTED_SAMPLE_RATES:
             raise ValueError(f"Sample rate must be one of {self.SUPPORTED_SAMPLE_RATES}")
         self.sample_rate = sample_rate
+        self._update_derived_timing()
 
     def set_buffer_size(self, buffer_size: int) -> None:
         """Set audio buffer size"""
         if buffer_size not in self.VALID_BUFFER_SIZES:
             raise ValueError(f"Buffer size must be one of {self.VALID_BUFFER_SIZES}")
         self.buffer_size = buffer_size
+        self._update_derived_timing()
 
     def set_input_channels(self, channels: List[int]) -> None:
         """Set active input channels"""
         if not channels:
             raise ValueError("At least one input channel must be specified")
-        if any(ch < 0 for ch in channels):
+        if min(channels) < 0:
             raise ValueError("Channel indices must be non-negative")
-        self.input_channels = channels.copy()
+        self.input_channels = tuple(channels)
 
     def set_output_channels(self, channels: List[int]) -> None:
         """Set active output channels"""
         if not channels:
             raise ValueError("At least one output channel must be specified")
-        if any(ch < 0 for ch in channels):
+        if min(channels) < 0:
             raise ValueError("Channel indices must be non-negative")
-        self.output_channels = channels.copy()
+        self.output_channels = tuple(channels)
 
     def set_measured_latency(self, latency_ms: float) -> None:
         """Set measured actual latency"""
@@ -86,12 +108,11 @@ class AudioInterface:
 
     def get_theoretical_latency_ms(self) -> float:
         """Calculate theoretical minimum latency based on buffer size and sample rate"""
-        return (self.buffer_size / self.sample_rate) * 1000
+        return self._theoretical_latency_ms
 
     def is_low_latency_config(self) -> bool:
         """Check if configuration is optimized for low latency"""
-        theoretical_latency = self.get_theoretical_latency_ms()
-        return theoretical_latency <= 10.0  # < 10ms for guitar processing
+        return self._low_latency
 
     def get_input_channel_count(self) -> int:
         """Get number of active input channels"""
@@ -103,15 +124,7 @@ class AudioInterface:
 
     def supports_real_time_processing(self) -> bool:
         """Check if configuration supports real-time audio processing"""
-        # Check if buffer size is reasonable for real-time processing
-        if self.buffer_size > 1024:
-            return False
-
-        # Check if sample rate is suitable
-        if self.sample_rate < 44100:
-            return False
-
-        return True
+        return self._real_time_capable
 
     def get_configuration_summary(self) -> Dict[str, Any]:
         """Get summary of current configuration"""
@@ -120,24 +133,28 @@ class AudioInterface:
             "output_device": self.output_device_name,
             "sample_rate": self.sample_rate,
             "buffer_size": self.buffer_size,
-            "input_channels": self.input_channels.copy(),
-            "output_channels": self.output_channels.copy(),
-            "theoretical_latency_ms": self.get_theoretical_latency_ms(),
+            "input_channels": list(self.input_channels),
+            "output_channels": list(self.output_channels),
+            "theoretical_latency_ms": self._theoretical_latency_ms,
             "measured_latency_ms": self.latency_ms,
-            "low_latency": self.is_low_latency_config(),
-            "real_time_capable": self.supports_real_time_processing()
+            "low_latency": self._low_latency,
+            "real_time_capable": self._real_time_capable
         }
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert audio interface to dictionary for serialization"""
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Convert audio interface to dictionary for serialization
+
+        With copy=False the channels are returned as the stored tuples, for
+        read-only consumers such as JSON encoding.
+        """
         return {
             "id": str(self.id),
             "input_device_name": self.input_device_name,
             "output_device_name": self.output_device_name,
             "sample_rate": self.sample_rate,
             "buffer_size": self.buffer_size,
-            "input_channels": self.input_channels.copy(),
-            "output_channels": self.output_channels.copy(),
+            "input_channels": list(self.input_channels) if copy else self.input_channels,
+            "output_channels": list(self.output_channels) if copy else self.output_channels,
             "latency_ms": self.latency_ms
         }
 
@@ -167,9 +184,15 @@ class AudioInterface:
 
     def copy(self) -> 'AudioInterface':
         """Create a copy of this audio interface with new ID"""
-        interface_dict = self.to_dict()
-        copy_interface = self.from_dict(interface_dict)
-        copy_interface.id = uuid4()  # Generate new ID for copy
+        copy_interface = self.__class__(
+            input_device_name=self.input_device_name,
+            output_device_name=self.output_device_name,
+            sample_rate=self.sample_rate,
+            buffer_size=self.buffer_size
+        )
+        copy_interface.input_channels = self.input_channels
+        copy_interface.output_channels = self.output_channels
+        copy_interface.latency_ms = self.latency_ms
         return copy_interface
 
     def __eq__(self, other) -> bool:
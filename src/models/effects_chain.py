@@ -1,8 +1,10 @@
-from uuid import UUID, uuid4
-from typing import List, Optional
-from datetime import datetime
+import time
+from uuid import UUID
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 
-from .audio_effect import AudioEffect
+from .audio_effect import AudioEffect, EffectType
+from ._ids import new_id
 
 
 class EffectsChain:
@@ -14,12 +16,27 @@ class EffectsChain:
         if not name or len(name) < 1 or len(name) > 50:
             raise ValueError("Chain name must be 1-50 characters")
 
-        self.id = uuid4()
+        self.id = new_id()
         self.name = name
         self.effects: List[AudioEffect] = []
+        self._effects_by_id: Dict[UUID, AudioEffect] = {}  # Kept in sync with effects
         self.active = False
         self.created_at = datetime.now()
-        self.modified_at = datetime.now()
+
+        # Mutations only record a monotonic tick; the wall-clock modified
+        # time is derived from it when read
+        self._modified_ns = time.monotonic_ns()
+        self.modified_at = self.created_at
+
+        # ISO strings reused by to_dict until the timestamps change
+        self._created_iso: Optional[Tuple[datetime, str]] = None
+        self._modified_iso: Optional[str] = None
+
+        # Mutation counter, also bumped by member effects when their bypass
+        # state changes; keys the cached (active count, type counts) summary
+        self._version = 0
+        self._summary_key: Optional[int] = None
+        self._summary: Tuple[int, Dict[EffectType, int]] = (0, {})
 
     def add_effect(self, effect: AudioEffect) -> None:
         """Add an effect to the end of the chain"""
@@ -27,24 +44,29 @@ class EffectsChain:
             raise ValueError(f"Maximum {self.MAX_EFFECTS} effects per chain")
 
         # Check for duplicate effect instances
-        if effect in self.effects:
+        if effect.id in self._effects_by_id:
             raise ValueError("Cannot have duplicate effect instances")
 
         # Set position for new effect
         effect.set_position(len(self.effects))
+        effect._owner = self
         self.effects.append(effect)
+        self._effects_by_id[effect.id] = effect
         self._update_modified_time()
 
     def remove_effect(self, effect_id: UUID) -> bool:
         """Remove an effect from the chain by ID"""
-        for i, effect in enumerate(self.effects):
-            if effect.id == effect_id:
-                removed_effect = self.effects.pop(i)
-                # Update positions of remaining effects
-                self._update_positions()
-                self._update_modified_time()
-                return True
-        return False
+        effect = self._effects_by_id.pop(effect_id, None)
+        if effect is None:
+            return False
+
+        self.effects.remove(effect)
+        if effect._owner is self:
+            effect._owner = None
+        # Update positions of remaining effects
+        self._update_positions()
+        self._update_modified_time()
+        return True
 
     def reorder_effects(self, effect_ids: List[UUID]) -> None:
         """Reorder effects according to provided ID list"""
@@ -52,16 +74,14 @@ class EffectsChain:
             raise ValueError("Effect ID list must contain all current effects")
 
         # Create new effects list in specified order
-        new_effects = []
-        for effect_id in effect_ids:
-            effect_found = False
-            for effect in self.effects:
-                if effect.id == effect_id:
-                    new_effects.append(effect)
-                    effect_found = True
-                    break
-            if not effect_found:
-                raise ValueError(f"Effect ID {effect_id} not found in chain")
+        effects_by_id = self._effects_by_id
+        try:
+            new_effects = [effects_by_id[effect_id] for effect_id in effect_ids]
+        except KeyError as e:
+            raise ValueError(f"Effect ID {e.args[0]} not found in chain")
+
+        if len(set(effect_ids)) != len(effects_by_id):
+            raise ValueError("Effect ID list must contain all current effects")
 
         # Update the effects list and positions
         self.effects = new_effects
@@ -70,10 +90,7 @@ class EffectsChain:
 
     def get_effect_by_id(self, effect_id: UUID) -> Optional[AudioEffect]:
         """Get an effect by its ID"""
-        for effect in self.effects:
-            if effect.id == effect_id:
-                return effect
-        return None
+        return self._effects_by_id.get(effect_id)
 
     def get_effects_by_type(self, effect_type) -> List[AudioEffect]:
         """Get all effects of a specific type"""
@@ -91,7 +108,11 @@ class EffectsChain:
 
     def clear_effects(self) -> None:
         """Remove all effects from the chain"""
+        for effect in self.effects:
+            if effect._owner is self:
+                effect._owner = None
         self.effects.clear()
+        self._effects_by_id.clear()
         self._update_modified_time()
 
     def copy(self, new_name: Optional[str] = None) -> 'EffectsChain':
@@ -112,20 +133,75 @@ class EffectsChain:
 
     def get_active_effects_count(self) -> int:
         """Get number of non-bypassed effects"""
-        return len([effect for effect in self.effects if not effect.bypassed])
+        return self._get_summary()[0]
 
     def has_effect_type(self, effect_type) -> bool:
         """Check if chain contains any effect of specified type"""
-        return any(effect.type == effect_type for effect in self.effects)
+        return effect_type in self._get_summary()[1]
+
+    def materialize(self) -> List[AudioEffect]:
+        """Build any effects that are still pending and return the chain's effects"""
+        return self.effects
+
+    def _get_summary(self) -> Tuple[int, Dict[EffectType, int]]:
+        """Get (active effect count, effect type counts), recomputed only after changes"""
+        effects = self.effects
+        key = self._version
+        if key != self._summary_key:
+            active_count = 0
+            type_counts: Dict[EffectType, int] = {}
+            for effect in effects:
+                if not effect.bypassed:
+                    active_count += 1
+                type_counts[effect.type] = type_counts.get(effect.type, 0) + 1
+            self._summary = (active_count, type_counts)
+            self._summary_key = key
+        return self._summary
+
+    def _bypass_changed(self) -> None:
+        """Called by a member effect whose bypass state changed"""
+        self._version += 1
 
     def _update_positions(self) -> None:
         """Update position values for all effects"""
         for i, effect in enumerate(self.effects):
             effect.set_position(i)
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever effects, their order or bypass state change"""
+        return self._version
+
+    @property
+    def modified_at(self) -> datetime:
+        """Wall-clock time of the last modification"""
+        elapsed_ns = self._modified_ns - self._modified_base_ns
+        return self._modified_base + timedelta(microseconds=elapsed_ns // 1000)
+
+    @modified_at.setter
+    def modified_at(self, value: datetime) -> None:
+        self._modified_base = value
+        self._modified_base_ns = self._modified_ns
+        self._modified_iso = None
+
     def _update_modified_time(self) -> None:
         """Update the modified timestamp"""
-        self.modified_at = datetime.now()
+        self._version += 1
+        self._modified_ns = time.monotonic_ns()
+        self._modified_iso = None
+
+    def _get_created_iso(self) -> str:
+        """Get created_at as an ISO string, formatted once per value"""
+        cached = self._created_iso
+        if cached is None or cached[0] is not self.created_at:
+            cached = self._created_iso = (self.created_at, self.created_at.isoformat())
+        return cached[1]
+
+    def _get_modified_iso(self) -> str:
+        """Get modified_at as an ISO string, formatted once per modification"""
+        if self._modified_iso is None:
+            self._modified_iso = self.modified_at.isoformat()
+        return self._modified_iso
 
     def to_dict(self) -> dict:
         """Convert effects chain to dictionary for serialization"""
@@ -134,13 +210,17 @@ class EffectsChain:
             "name": self.name,
             "effects": [effect.to_dict() for effect in self.effects],
             "active": self.active,
-            "created_at": self.created_at.isoformat(),
-            "modified_at": self.modified_at.isoformat()
+            "created_at": self._get_created_iso(),
+            "modified_at": self._get_modified_iso()
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'EffectsChain':
-        """Create effects chain from dictionary"""
+    def from_dict(cls, data: dict, *, trusted: bool = False) -> 'EffectsChain':
+        """Create effects chain from dictionary
+
+        Pass trusted=True only for data produced by to_dict in this process;
+        effect parameters are then not re-validated.
+        """
         chain = cls(data["name"])
 
         if "id" in data:
@@ -148,16 +228,23 @@ class EffectsChain:
 
         chain.active = data.get("active", False)
 
+        # Keep the loaded ISO strings so re-serializing skips formatting
         if "created_at" in data:
             chain.created_at = datetime.fromisoformat(data["created_at"])
+            chain._created_iso = (chain.created_at, data["created_at"])
 
         if "modified_at" in data:
             chain.modified_at = datetime.fromisoformat(data["modified_at"])
+            chain._modified_iso = data["modified_at"]
 
         # Add effects
+        create_effect = AudioEffect._from_trusted_dict if trusted else AudioEffect.from_dict
         for effect_data in data.get("effects", []):
-            effect = AudioEffect.from_dict(effect_data)
+            effect = create_effect(effect_data)
+            effect._owner = chain
             chain.effects.append(effect)
+            chain._effects_by_id[effect.id] = effect
+        chain._version += 1
 
         return chain
 
@@ -174,4 +261,65 @@ class EffectsChain:
         return iter(self.effects)
 
     def __repr__(self) -> str:
-        return f"EffectsChain(name='{self.name}', effects={len(self.effects)}, active={self.active})"
\ No newline at end of file
+        return f"EffectsChain(name='{self.name}', effects={len(self.effects)}, active={self.active})"
+
+
+class LazyEffectsChain(EffectsChain):
+    """Effects chain that defers building its effects until first accessed"""
+
+    def __init__(
+        self,
+        name: str,
+        effect_configs: List[Dict[str, Any]],
+        effect_factory: Callable[[Dict[str, Any]], AudioEffect]
+    ):
+        if len(effect_configs) > self.MAX_EFFECTS:
+            raise ValueError(f"Maximum {self.MAX_EFFECTS} effects per chain")
+
+        self._pending_configs: Optional[List[Dict[str, Any]]] = list(effect_configs)
+        self._effect_factory = effect_factory
+        super().__init__(name)
+
+    @property
+    def effects(self) -> List[AudioEffect]:
+        """Effects in chain order, built from their configs on first access"""
+        return self.materialize()
+
+    def materialize(self) -> List[AudioEffect]:
+        """Build the pending effects now, raising if any config is invalid"""
+        if self._pending_configs is not None:
+            self._materialize_effects()
+        return self._effects
+
+    @effects.setter
+    def effects(self, effects: List[AudioEffect]) -> None:
+        self._effects = effects
+
+    @property
+    def _effects_by_id(self) -> Dict[UUID, AudioEffect]:
+        """ID index, which also requires the pending effects to be built"""
+        if self._pending_configs is not None:
+            self._materialize_effects()
+        return self._effects_index
+
+    @_effects_by_id.setter
+    def _effects_by_id(self, effects_by_id: Dict[UUID, AudioEffect]) -> None:
+        self._effects_index = effects_by_id
+
+    def _materialize_effects(self) -> None:
+        """Build pending effects; configs are kept if any effect fails to build"""
+        new_effects = [self._effect_factory(config) for config in self._pending_configs]
+        for position, effect in enumerate(new_effects):
+            effect.set_position(position)
+            effect._owner = self
+
+        self._pending_configs = None
+        self._effects.extend(new_effects)
+        self._effects_index.update((effect.id, effect) for effect in new_effects)
+        self._version += 1
+
+    def __len__(self) -> int:
+        """Return number of effects in chain without building them"""
+        if self._pending_configs is not None:
+            return len(self._pending_configs)
+        return len(self._effects)
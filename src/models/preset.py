@@ -1,16 +1,41 @@
-import json
+import itertools
 import re
-from uuid import UUID, uuid4
-from typing import Dict, Any, List, Optional
+from uuid import UUID
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-from .effects_chain import EffectsChain
+from .. import _json
+from .effects_chain import EffectsChain, LazyEffectsChain
 from .audio_effect import AudioEffect, EffectType
+from ._ids import new_id
+
+# Allowed tag characters: alphanumerics, hyphens and underscores
+_TAG_RE = re.compile(r'\A[a-zA-Z0-9_-]+\Z')
+
+
+def _validate_tags(tags: List[str]) -> None:
+    """Raise ValueError if any tag has characters outside the allowed set"""
+    for tag in tags:
+        # Plain ASCII alphanumeric tags pass via C string methods, skipping the regex
+        if tag.isascii() and tag.isalnum():
+            continue
+        if not _TAG_RE.match(tag):
+            raise ValueError("Tags must be alphanumeric with hyphens/underscores only")
 
 
 class Preset:
     """Saved configuration of complete effects chain"""
 
+    __slots__ = (
+        "id", "name", "description", "effects_chain_config", "created_at",
+        "modified_at", "tags", "author", "version",
+        "_version_seq", "_created_iso", "_search_text",
+    )
+
+    # Process-wide sequence stamped on every creation and update, so changes
+    # are ordered even when modified_at does not advance between them
+    _version_counter = itertools.count()
+
     def __init__(
         self,
         name: str,
@@ -30,16 +55,19 @@ class Preset:
 
         # Validate tags
         if tags:
-            for tag in tags:
-                if not re.match(r'^[a-zA-Z0-9_-]+$', tag):
-                    raise ValueError("Tags must be alphanumeric with hyphens/underscores only")
+            _validate_tags(tags)
 
-        self.id = uuid4()
+        self.id = new_id()
         self.name = name
         self.description = description
         self.effects_chain_config = effects_chain_config
         self.created_at = datetime.now()
         self.modified_at = datetime.now()
+        self._version_seq = next(Preset._version_counter)
+        # (created_at, ISO string) reused while created_at is the same object
+        self._created_iso: Optional[Tuple[datetime, str]] = None
+        # (name, description, lowercased search text) for matches_search
+        self._search_text: Optional[Tuple[str, Optional[str], str]] = None
         self.tags = tags or []
         self.author = author
         self.version = version
@@ -83,37 +111,50 @@ class Preset:
         )
 
     def to_effects_chain(self) -> EffectsChain:
-        """Create an effects chain from this preset"""
+        """Create an effects chain from this preset
+
+        Effects are built when the chain's effects are first accessed, so
+        callers that only need the chain's name or length never build them;
+        call materialize() on the chain to build and validate them up front.
+        """
         # Use preset name as chain name
-        chain = EffectsChain(name=self.name)
+        return LazyEffectsChain(
+            name=self.name,
+            effect_configs=self.effects_chain_config.get("effects", []),
+            effect_factory=self._create_effect
+        )
 
-        for effect_config in self.effects_chain_config.get("effects", []):
-            effect_type = EffectType(effect_config["type"])
-            effect = AudioEffect(
-                effect_type=effect_type,
-                parameters=effect_config.get("parameters", {})
-            )
+    @staticmethod
+    def _create_effect(effect_config: Dict[str, Any]) -> AudioEffect:
+        """Create an effect from a preset effect config"""
+        effect_type = EffectType(effect_config["type"])
+        effect = AudioEffect(
+            effect_type=effect_type,
+            parameters=effect_config.get("parameters", {})
+        )
 
-            # Set additional properties
-            effect.set_bypassed(effect_config.get("bypassed", False))
+        # Set additional properties
+        effect.set_bypassed(effect_config.get("bypassed", False))
 
-            if "preset_name" in effect_config:
-                effect.set_preset_name(effect_config["preset_name"])
+        if "preset_name" in effect_config:
+            effect.set_preset_name(effect_config["preset_name"])
 
-            chain.add_effect(effect)
+        return effect
 
-        return chain
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Convert preset to dictionary for serialization
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert preset to dictionary for serialization"""
+        With copy=False the effects config and tags are shared with the
+        preset, for read-only consumers such as JSON encoding.
+        """
         return {
             "id": str(self.id),
             "name": self.name,
             "description": self.description,
-            "effects_chain_config": self.effects_chain_config.copy(),
-            "created_at": self.created_at.isoformat(),
+            "effects_chain_config": self.effects_chain_config.copy() if copy else self.effects_chain_config,
+            "created_at": self._get_created_iso(),
             "modified_at": self.modified_at.isoformat(),
-            "tags": self.tags.copy(),
+            "tags": self.tags.copy() if copy else self.tags,
             "author": self.author,
             "version": self.version
         }
@@ -135,6 +176,7 @@ class Preset:
 
         if "created_at" in data:
             preset.created_at = datetime.fromisoformat(data["created_at"])
+            preset._created_iso = (preset.created_at, data["created_at"])
 
         if "modified_at" in data:
             preset.modified_at = datetime.fromisoformat(data["modified_at"])
@@ -143,15 +185,15 @@ class Preset:
 
     def to_json(self) -> str:
         """Convert preset to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+        return _json.dumps(self.to_dict(copy=False)).decode('utf-8')
 
     @classmethod
     def from_json(cls, json_str: str) -> 'Preset':
         """Create preset from JSON string"""
         try:
-            data = json.loads(json_str)
+            data = _json.loads(json_str)
             return cls.from_dict(data)
-        except json.JSONDecodeError as e:
+        except _json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {e}")
         except Exception as e:
             raise ValueError(f"Invalid preset data: {e}")
@@ -175,15 +217,21 @@ class Preset:
             self.description = description
 
         if tags is not None:
-            for tag in tags:
-                if not re.match(r'^[a-zA-Z0-9_-]+$', tag):
-                    raise ValueError("Tags must be alphanumeric with hyphens/underscores only")
+            _validate_tags(tags)
             self.tags = tags
 
         if effects_chain_config is not None:
             self.effects_chain_config = effects_chain_config
 
         self.modified_at = datetime.now()
+        self._version_seq = next(Preset._version_counter)
+
+    def _get_created_iso(self) -> str:
+        """Get created_at as an ISO string, formatted once per value"""
+        cached = self._created_iso
+        if cached is None or cached[0] is not self.created_at:
+            cached = self._created_iso = (self.created_at, self.created_at.isoformat())
+        return cached[1]
 
     def get_effect_count(self) -> int:
         """Get number of effects in this preset"""
@@ -195,13 +243,18 @@ class Preset:
 
     def matches_search(self, search_term: str) -> bool:
         """Check if preset matches search term in name or description"""
-        search_lower = search_term.lower()
-        name_match = search_lower in self.name.lower()
-        desc_match = (
-            self.description is not None and
-            search_lower in self.description.lower()
-        )
-        return name_match or desc_match
+        return search_term.lower() in self._get_search_text()
+
+    def _get_search_text(self) -> str:
+        """Get lowercased name and description, rebuilt only when either changes"""
+        cached = self._search_text
+        if cached is None or cached[0] is not self.name or cached[1] is not self.description:
+            # NUL separator so a term cannot match across the field boundary
+            text = self.name.lower()
+            if self.description is not None:
+                text += "\0" + self.description.lower()
+            cached = self._search_text = (self.name, self.description, text)
+        return cached[2]
 
     def copy(self, new_name: Optional[str] = None) -> 'Preset':
         """Create a copy of this preset with new ID"""
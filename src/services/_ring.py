@@ -0,0 +1,77 @@
+"""Single-producer/single-consumer audio frame ring"""
+
+import numpy as np
+
+
+class FrameRing:
+    """Fixed-capacity ring of (frames, channels) float32 audio
+
+    One thread may write and one other thread may read without locking:
+    each side only ever advances its own counter, and only after the
+    samples it covers have been copied. Capacity is rounded up to a power
+    of two so positions are masked rather than taken modulo.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_mask", "_read", "_write")
+
+    def __init__(self, min_frames: int, channels: int):
+        capacity = 1 << max(0, int(min_frames) - 1).bit_length()
+        self._buf = np.zeros((capacity, channels), dtype=np.float32)
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._read = 0
+        self._write = 0
+
+    @property
+    def capacity(self) -> int:
+        """Total number of frames the ring can hold"""
+        return self._capacity
+
+    def available(self) -> int:
+        """Number of frames ready to be read"""
+        return self._write - self._read
+
+    def space(self) -> int:
+        """Number of frames that can be written without overwriting unread ones"""
+        return self._capacity - (self._write - self._read)
+
+    def write(self, block: np.ndarray) -> bool:
+        """Copy a (frames, channels) block in; returns False if it does not fit"""
+        frames = block.shape[0]
+        if frames > self.space():
+            return False
+
+        start = self._write & self._mask
+        first = min(frames, self._capacity - start)
+        self._buf[start:start + first] = block[:first]
+        if first < frames:
+            self._buf[:frames - first] = block[first:]
+
+        self._write += frames
+        return True
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """Fill a (frames, channels) array; returns False if not enough is buffered"""
+        frames = out.shape[0]
+        if frames > self._write - self._read:
+            return False
+
+        start = self._read & self._mask
+        first = min(frames, self._capacity - start)
+        out[:first] = self._buf[start:start + first]
+        if first < frames:
+            out[first:] = self._buf[:frames - first]
+
+        self._read += frames
+        return True
+
+    def fill_silence(self, frames: int) -> None:
+        """Queue frames of silence, e.g. to pre-fill before the reader starts"""
+        frames = min(frames, self.space())
+        start = self._write & self._mask
+        first = min(frames, self._capacity - start)
+        self._buf[start:start + first] = 0.0
+        if first < frames:
+            self._buf[:frames - first] = 0.0
+
+        self._write += frames
@@ -1,10 +1,135 @@
-import json
 import os
-from typing import Dict, Any, Optional, List
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, Tuple, Callable
 from pathlib import Path
 
+from .. import _json
 from ..models.audio_interface import AudioInterface
 
+# Longest time a changed setting waits before it is written to disk; changes
+# made in the meantime are coalesced into the same write
+_FLUSH_DELAY_SECONDS = 0.25
+
+# Default configurations, shared by every service instance
+_DEFAULT_AUDIO_CONFIG = MappingProxyType({
+    "sample_rate": 48000,
+    "buffer_size": 256,
+    "input_device": "Scarlett 18i8 USB",
+    "output_device": "Scarlett 18i8 USB",
+    "input_channels": [0, 1],  # Both input 1 (vocal) and input 2 (guitar)
+    "output_channels": [0, 1],
+    "auto_connect": True,
+    "low_latency_mode": True
+})
+
+_DEFAULT_UI_CONFIG = MappingProxyType({
+    "window_width": 800,
+    "window_height": 600,
+    "window_x": 100,
+    "window_y": 100,
+    "theme": "dark",
+    "show_advanced_controls": False,
+    "parameter_update_rate": 60,  # Hz
+    "meter_update_rate": 30,      # Hz
+    "auto_save_presets": True
+})
+
+_DEFAULT_APP_CONFIG = MappingProxyType({
+    "version": "1.0.0",
+    "last_preset_id": None,
+    "auto_load_last_preset": True,
+    "check_for_updates": True,
+    "telemetry_enabled": False,
+    "log_level": "INFO",
+    "max_recent_presets": 10,
+    "recent_presets": []
+})
+
+# Defaults as written to a fresh config file, serialized once at import
+_DEFAULT_AUDIO_BYTES = _json.dumps(dict(_DEFAULT_AUDIO_CONFIG))
+_DEFAULT_UI_BYTES = _json.dumps(dict(_DEFAULT_UI_CONFIG))
+_DEFAULT_APP_BYTES = _json.dumps(dict(_DEFAULT_APP_CONFIG))
+
+_VALID_SAMPLE_RATES = frozenset((44100, 48000, 96000))
+_VALID_BUFFER_SIZES = frozenset((32, 64, 128, 256, 512, 1024, 2048))
+_VALID_THEMES = frozenset(("light", "dark"))
+
+# Validation rules built once at import: key -> (predicate, error message),
+# checked in this order for every key present in an update
+_AUDIO_RULES = {
+    "sample_rate": (lambda v: v in _VALID_SAMPLE_RATES, "Invalid sample rate"),
+    "buffer_size": (lambda v: v in _VALID_BUFFER_SIZES, "Invalid buffer size"),
+    "input_channels": (lambda v: isinstance(v, list) and bool(v),
+                       "Input channels must be a non-empty list"),
+    "output_channels": (lambda v: isinstance(v, list) and bool(v),
+                        "Output channels must be a non-empty list"),
+}
+
+_UI_RULES = {
+    "window_width": (lambda v: isinstance(v, int) and v >= 400,
+                     "Window width must be at least 400 pixels"),
+    "window_height": (lambda v: isinstance(v, int) and v >= 300,
+                      "Window height must be at least 300 pixels"),
+    "theme": (lambda v: v in _VALID_THEMES, "Theme must be 'light' or 'dark'"),
+    "parameter_update_rate": (lambda v: isinstance(v, int) and v >= 1,
+                              "Parameter update rate must be at least 1 Hz"),
+}
+
+
+def _check_rules(config: Mapping[str, Any], rules: Dict[str, Tuple[Callable[[Any], bool], str]]) -> None:
+    """Raise ValueError for the first key in config that fails its rule"""
+    for key, (is_valid, message) in rules.items():
+        if key in config:
+            try:
+                valid = is_valid(config[key])
+            except TypeError:
+                # Unhashable values cannot be members of the allowed sets
+                valid = False
+            if not valid:
+                raise ValueError(message)
+
+
+def _timestamp_ns(value: Any) -> Any:
+    """Normalize a recent-preset timestamp to integer nanoseconds; accepts older ISO strings"""
+    if isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+        return (int(dt.timestamp()) * 1_000_000 + dt.microsecond) * 1000
+    return value
+
+
+def _timestamp_iso(value: Any) -> Any:
+    """Format an integer nanosecond timestamp as a local ISO string for display"""
+    if isinstance(value, int):
+        seconds, nanoseconds = divmod(value, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+    return value
+
+
+def _display_recent_preset(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy of a recent-preset entry with its timestamp as an ISO string"""
+    display = dict(entry)
+    if "timestamp" in display:
+        display["timestamp"] = _timestamp_iso(display["timestamp"])
+    return display
+
+
+def _new_config(defaults: Mapping[str, Any]) -> Dict[str, Any]:
+    """Fresh config dict from defaults; list values are copied so no instance shares them"""
+    return {key: value.copy() if isinstance(value, list) else value for key, value in defaults.items()}
+
+
+def _has_changes(current: Mapping[str, Any], update: Mapping[str, Any]) -> bool:
+    """Whether applying update to current would change any value"""
+    return any(key not in current or current[key] != value for key, value in update.items())
+
 
 class ConfigurationService:
     """Service for application settings and device configuration persistence"""
@@ -24,54 +149,56 @@ class ConfigurationService:
         self.ui_config_file = self.config_dir / "ui_config.json"
         self.app_config_file = self.config_dir / "app_config.json"
 
-        # Default configurations
-        self._default_audio_config = {
-            "sample_rate": 48000,
-            "buffer_size": 256,
-            "input_device": "Scarlett 18i8 USB",
-            "output_device": "Scarlett 18i8 USB",
-            "input_channels": [0, 1],  # Both input 1 (vocal) and input 2 (guitar)
-            "output_channels": [0, 1],
-            "auto_connect": True,
-            "low_latency_mode": True
-        }
+        # Names of configs changed since the last write, and the pending write
+        self._dirty: set = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
 
-        self._default_ui_config = {
-            "window_width": 800,
-            "window_height": 600,
-            "window_x": 100,
-            "window_y": 100,
-            "theme": "dark",
-            "show_advanced_controls": False,
-            "parameter_update_rate": 60,  # Hz
-            "meter_update_rate": 30,      # Hz
-            "auto_save_presets": True
-        }
+        # Read-only snapshots handed out by the getters, rebuilt after a change
+        self._views: Dict[str, Any] = {}
 
-        self._default_app_config = {
-            "version": "1.0.0",
-            "last_preset_id": None,
-            "auto_load_last_preset": True,
-            "check_for_updates": True,
-            "telemetry_enabled": False,
-            "log_level": "INFO",
-            "max_recent_presets": 10,
-            "recent_presets": []
-        }
+        # Configurations are read from disk on first access, keyed by type
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+        self._recent_index: Optional[OrderedDict] = None
 
-        # Load configurations
-        self._audio_config = self._load_or_create_config(
-            self.audio_config_file, self._default_audio_config
-        )
-        self._ui_config = self._load_or_create_config(
-            self.ui_config_file, self._default_ui_config
-        )
-        self._app_config = self._load_or_create_config(
-            self.app_config_file, self._default_app_config
-        )
+    @property
+    def _audio_config(self) -> Dict[str, Any]:
+        return self._ensure_loaded("audio")
+
+    @_audio_config.setter
+    def _audio_config(self, config: Dict[str, Any]) -> None:
+        self._loaded["audio"] = config
+
+    @property
+    def _ui_config(self) -> Dict[str, Any]:
+        return self._ensure_loaded("ui")
+
+    @_ui_config.setter
+    def _ui_config(self, config: Dict[str, Any]) -> None:
+        self._loaded["ui"] = config
+
+    @property
+    def _app_config(self) -> Dict[str, Any]:
+        return self._ensure_loaded("app")
+
+    @_app_config.setter
+    def _app_config(self, config: Dict[str, Any]) -> None:
+        self._loaded["app"] = config
+
+    @property
+    def _recent_presets(self) -> OrderedDict:
+        self._ensure_loaded("app")
+        return self._recent_index
+
+    def get_audio_config(self) -> Mapping[str, Any]:
+        """Get a read-only snapshot of the current audio configuration"""
+        view = self._views.get("audio")
+        if view is None:
+            view = self._views["audio"] = MappingProxyType(self._audio_config.copy())
+        return view
 
-    def get_audio_config(self) -> Dict[str, Any]:
-        """Get current audio configuration"""
+    def get_audio_config_mutable(self) -> Dict[str, Any]:
+        """Get a private copy of the audio configuration that may be modified"""
         return self._audio_config.copy()
 
     def set_audio_config(self, config: Dict[str, Any]) -> None:
@@ -80,14 +207,18 @@ class ConfigurationService:
         self._validate_audio_config(config)
 
         # Update configuration
-        self._audio_config.update(config)
-
-        # Save to file
-        self._save_config(self.audio_config_file, self._audio_config)
-
-    def get_ui_config(self) -> Dict[str, Any]:
-        """Get current UI configuration"""
-        return self._ui_config.copy()
+        with self._lock:
+            if not _has_changes(self._audio_config, config):
+                return
+            self._audio_config.update(config)
+            self._mark_dirty("audio")
+
+    def get_ui_config(self) -> Mapping[str, Any]:
+        """Get a read-only snapshot of the current UI configuration"""
+        view = self._views.get("ui")
+        if view is None:
+            view = self._views["ui"] = MappingProxyType(self._ui_config.copy())
+        return view
 
     def set_ui_config(self, config: Dict[str, Any]) -> None:
         """Update UI configuration"""
@@ -95,26 +226,40 @@ class ConfigurationService:
         self._validate_ui_config(config)
 
         # Update configuration
-        self._ui_config.update(config)
-
-        # Save to file
-        self._save_config(self.ui_config_file, self._ui_config)
-
-    def get_app_config(self) -> Dict[str, Any]:
-        """Get current application configuration"""
-        return self._app_config.copy()
+        with self._lock:
+            if not _has_changes(self._ui_config, config):
+                return
+            self._ui_config.update(config)
+            self._mark_dirty("ui")
+
+    def get_app_config(self) -> Mapping[str, Any]:
+        """Get a read-only snapshot of the current application configuration"""
+        view = self._views.get("app")
+        if view is None:
+            self._sync_recent_presets()
+            config = self._app_config.copy()
+            config["recent_presets"] = [_display_recent_preset(p) for p in config["recent_presets"]]
+            view = self._views["app"] = MappingProxyType(config)
+        return view
 
     def set_app_config(self, config: Dict[str, Any]) -> None:
         """Update application configuration"""
         # Update configuration
-        self._app_config.update(config)
-
-        # Save to file
-        self._save_config(self.app_config_file, self._app_config)
+        with self._lock:
+            # The recent presets list is only synced from its index lazily
+            self._sync_recent_presets()
+            if not _has_changes(self._app_config, config):
+                return
+            self._app_config.update(config)
+            if "recent_presets" in config:
+                self._index_recent_presets()
+            self._mark_dirty("app")
 
     def create_audio_interface(self) -> AudioInterface:
         """Create AudioInterface from current configuration"""
-        config = self.get_audio_config()
+        # Read-only use, so the live config is read without a snapshot; the
+        # channel setters take their own tuple copies
+        config = self._audio_config
 
         # Use default devices if not specified
         input_device = config["input_device"] or "Default Input"
@@ -139,42 +284,49 @@ class ConfigurationService:
             "output_device": audio_interface.output_device_name,
             "sample_rate": audio_interface.sample_rate,
             "buffer_size": audio_interface.buffer_size,
-            "input_channels": audio_interface.input_channels.copy(),
-            "output_channels": audio_interface.output_channels.copy()
+            "input_channels": list(audio_interface.input_channels),
+            "output_channels": list(audio_interface.output_channels)
         }
 
         self.set_audio_config(config)
 
     def add_recent_preset(self, preset_id: str, preset_name: str) -> None:
         """Add preset to recent presets list"""
-        recent_presets = self._app_config["recent_presets"]
-        max_recent = self._app_config["max_recent_presets"]
-
-        # Remove if already exists
-        recent_presets = [p for p in recent_presets if p["id"] != preset_id]
-
-        # Add to beginning
-        recent_presets.insert(0, {
-            "id": preset_id,
-            "name": preset_name,
-            "timestamp": self._get_current_timestamp()
-        })
-
-        # Limit to max recent
-        recent_presets = recent_presets[:max_recent]
-
-        # Update config
-        self._app_config["recent_presets"] = recent_presets
-        self._save_config(self.app_config_file, self._app_config)
-
-    def get_recent_presets(self) -> List[Dict[str, Any]]:
-        """Get list of recent presets"""
-        return self._app_config["recent_presets"].copy()
+        with self._lock:
+            recent_presets = self._recent_presets
+            max_recent = self._app_config["max_recent_presets"]
+
+            # Remove if already exists, then add to the front
+            recent_presets.pop(preset_id, None)
+            recent_presets[preset_id] = {
+                "id": preset_id,
+                "name": preset_name,
+                "timestamp": self._get_current_timestamp()
+            }
+            recent_presets.move_to_end(preset_id, last=False)
+
+            # Limit to max recent
+            while len(recent_presets) > max_recent:
+                recent_presets.popitem(last=True)
+
+            self._mark_dirty("app")
+
+    def get_recent_presets(self) -> Tuple[Mapping[str, Any], ...]:
+        """Get a read-only snapshot of the recent presets list"""
+        view = self._views.get("recent_presets")
+        if view is None:
+            view = self._views["recent_presets"] = tuple(
+                MappingProxyType(_display_recent_preset(p)) for p in self._recent_presets.values()
+            )
+        return view
 
     def set_last_preset(self, preset_id: str) -> None:
         """Set the last used preset"""
-        self._app_config["last_preset_id"] = preset_id
-        self._save_config(self.app_config_file, self._app_config)
+        with self._lock:
+            if self._app_config.get("last_preset_id") == preset_id:
+                return
+            self._app_config["last_preset_id"] = preset_id
+            self._mark_dirty("app")
 
     def get_last_preset(self) -> Optional[str]:
         """Get the last used preset ID"""
@@ -205,32 +357,49 @@ class ConfigurationService:
 
     def set_theme(self, theme: str) -> None:
         """Set UI theme"""
-        if theme not in ["light", "dark"]:
+        if theme not in _VALID_THEMES:
             raise ValueError("Theme must be 'light' or 'dark'")
 
         self.set_ui_config({"theme": theme})
 
     def reset_to_defaults(self, config_type: str) -> None:
         """Reset configuration to defaults"""
-        if config_type == "audio":
-            self._audio_config = self._default_audio_config.copy()
-            self._save_config(self.audio_config_file, self._audio_config)
-        elif config_type == "ui":
-            self._ui_config = self._default_ui_config.copy()
-            self._save_config(self.ui_config_file, self._ui_config)
-        elif config_type == "app":
-            self._app_config = self._default_app_config.copy()
-            self._save_config(self.app_config_file, self._app_config)
-        else:
-            raise ValueError("Invalid config type")
-
-    def export_config(self) -> Dict[str, Any]:
+        with self._lock:
+            if config_type == "audio":
+                self._audio_config = _new_config(_DEFAULT_AUDIO_CONFIG)
+            elif config_type == "ui":
+                self._ui_config = _new_config(_DEFAULT_UI_CONFIG)
+            elif config_type == "app":
+                self._app_config = _new_config(_DEFAULT_APP_CONFIG)
+                self._index_recent_presets()
+            else:
+                raise ValueError("Invalid config type")
+
+            self._mark_dirty(config_type)
+
+    def flush(self) -> None:
+        """Write any changed configuration to disk now"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            self._save_all_dirty()
+
+    def close(self) -> None:
+        """Flush pending changes; call before discarding the service"""
+        self.flush()
+
+    def export_config(self) -> Dict[str, Dict[str, Any]]:
         """Export all configuration"""
-        return {
-            "audio": self._audio_config.copy(),
-            "ui": self._ui_config.copy(),
-            "app": self._app_config.copy()
-        }
+        with self._lock:
+            app_config = dict(self.get_app_config())
+            app_config["recent_presets"] = [dict(p) for p in app_config["recent_presets"]]
+            return {
+                "audio": _new_config(self.get_audio_config()),
+                "ui": _new_config(self.get_ui_config()),
+                "app": app_config
+            }
 
     def import_config(self, config_data: Dict[str, Any]) -> None:
         """Import configuration data"""
@@ -243,74 +412,141 @@ class ConfigurationService:
         if "app" in config_data:
             self.set_app_config(config_data["app"])
 
-    def _load_or_create_config(self, file_path: Path, default_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _load_or_create_config(self, file_path: Path, default_config: Mapping[str, Any],
+                               default_bytes: Optional[bytes] = None) -> Dict[str, Any]:
         """Load configuration from file or create with defaults"""
         if file_path.exists():
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(file_path, 'rb') as f:
+                    config = _json.loads(f.read())
 
                 # Merge with defaults to handle new keys
-                merged_config = default_config.copy()
-                merged_config.update(config)
-                return merged_config
+                return _new_config(default_config) | config
 
             except Exception as e:
                 print(f"Error loading config {file_path}: {e}")
 
         # Create default configuration
-        config = default_config.copy()
-        self._save_config(file_path, config)
+        config = _new_config(default_config)
+        if default_bytes is not None:
+            self._write_config_file(file_path, default_bytes)
+        else:
+            self._save_config(file_path, config)
+        return config
+
+    def _mark_dirty(self, config_type: str) -> None:
+        """Schedule a write of the named config, coalescing with one already pending"""
+        with self._lock:
+            self._invalidate_views(config_type)
+            self._dirty.add(config_type)
+            if self._flush_timer is None:
+                # Not a daemon, so pending changes are still written at interpreter exit
+                self._flush_timer = threading.Timer(_FLUSH_DELAY_SECONDS, self.flush)
+                self._flush_timer.start()
+
+    def _invalidate_views(self, config_type: str) -> None:
+        """Drop cached getter snapshots of the named config"""
+        self._views.pop(config_type, None)
+        if config_type == "app":
+            self._views.pop("recent_presets", None)
+
+    def _config_source(self, config_type: str) -> Tuple[Path, Mapping[str, Any], bytes]:
+        """File path, defaults and serialized defaults for the named config"""
+        if config_type == "audio":
+            return self.audio_config_file, _DEFAULT_AUDIO_CONFIG, _DEFAULT_AUDIO_BYTES
+        if config_type == "ui":
+            return self.ui_config_file, _DEFAULT_UI_CONFIG, _DEFAULT_UI_BYTES
+        return self.app_config_file, _DEFAULT_APP_CONFIG, _DEFAULT_APP_BYTES
+
+    def _ensure_loaded(self, config_type: str) -> Dict[str, Any]:
+        """Return the named config, reading it from disk on first use"""
+        config = self._loaded.get(config_type)
+        if config is None:
+            with self._lock:
+                config = self._loaded.get(config_type)
+                if config is None:
+                    file_path, default_config, default_bytes = self._config_source(config_type)
+                    config = self._load_or_create_config(file_path, default_config, default_bytes)
+                    self._loaded[config_type] = config
+                    if config_type == "app":
+                        self._index_recent_presets()
         return config
 
+    def _index_recent_presets(self) -> None:
+        """Rebuild the id-keyed recent presets index from the app config list
+
+        Timestamps are kept as integer nanoseconds; ISO strings written by
+        older versions (or passed in from get_app_config) are converted.
+        """
+        index = OrderedDict()
+        for p in self._app_config["recent_presets"]:
+            if isinstance(p.get("timestamp"), str):
+                p = dict(p, timestamp=_timestamp_ns(p["timestamp"]))
+            index[p["id"]] = p
+        self._recent_index = index
+
+    def _sync_recent_presets(self) -> None:
+        """Copy the recent presets index back into the app config list"""
+        recent_presets = list(self._recent_presets.values())
+        self._app_config["recent_presets"] = recent_presets
+
+    def _save_all_dirty(self) -> None:
+        """Write every changed config in one pass; caller holds the lock"""
+        dirty, self._dirty = self._dirty, set()
+        if "app" in dirty:
+            self._sync_recent_presets()
+        for config_type in ("audio", "ui", "app"):
+            if config_type in dirty:
+                file_path = self._config_source(config_type)[0]
+                self._save_config(file_path, self._loaded[config_type])
+
     def _save_config(self, file_path: Path, config: Dict[str, Any]) -> None:
         """Save configuration to file"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            data = _json.dumps(config)
         except Exception as e:
             print(f"Error saving config {file_path}: {e}")
+            return
 
-    def _validate_audio_config(self, config: Dict[str, Any]) -> None:
-        """Validate audio configuration"""
-        if "sample_rate" in config:
-            if config["sample_rate"] not in [44100, 48000, 96000]:
-                raise ValueError("Invalid sample rate")
-
-        if "buffer_size" in config:
-            if config["buffer_size"] not in [32, 64, 128, 256, 512, 1024, 2048]:
-                raise ValueError("Invalid buffer size")
+        self._write_config_file(file_path, data)
 
-        if "input_channels" in config:
-            if not isinstance(config["input_channels"], list) or not config["input_channels"]:
-                raise ValueError("Input channels must be a non-empty list")
+    def _write_config_file(self, file_path: Path, data: bytes) -> None:
+        """Write serialized configuration to file
 
-        if "output_channels" in config:
-            if not isinstance(config["output_channels"], list) or not config["output_channels"]:
-                raise ValueError("Output channels must be a non-empty list")
+        The data is written to a sibling temporary file and renamed over the
+        target, so a crash mid-write never leaves a truncated config behind.
+        """
+        tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            print(f"Error saving config {file_path}: {e}")
 
-    def _validate_ui_config(self, config: Dict[str, Any]) -> None:
-        """Validate UI configuration"""
-        if "window_width" in config:
-            if not isinstance(config["window_width"], int) or config["window_width"] < 400:
-                raise ValueError("Window width must be at least 400 pixels")
+    def _copy_config_file(self, source: Path, target: Path) -> None:
+        """Copy a config file through a temporary file renamed into place
 
-        if "window_height" in config:
-            if not isinstance(config["window_height"], int) or config["window_height"] < 300:
-                raise ValueError("Window height must be at least 300 pixels")
+        copyfile lets the kernel do the copy (sendfile on Linux); permission
+        bits and timestamps are not carried over since nothing reads them.
+        """
+        tmp_path = target.with_suffix(target.suffix + '.tmp')
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, target)
 
-        if "theme" in config:
-            if config["theme"] not in ["light", "dark"]:
-                raise ValueError("Theme must be 'light' or 'dark'")
+    def _validate_audio_config(self, config: Dict[str, Any]) -> None:
+        """Validate audio configuration"""
+        _check_rules(config, _AUDIO_RULES)
 
-        if "parameter_update_rate" in config:
-            if not isinstance(config["parameter_update_rate"], int) or config["parameter_update_rate"] < 1:
-                raise ValueError("Parameter update rate must be at least 1 Hz")
+    def _validate_ui_config(self, config: Dict[str, Any]) -> None:
+        """Validate UI configuration"""
+        _check_rules(config, _UI_RULES)
 
-    def _get_current_timestamp(self) -> str:
-        """Get current timestamp as ISO string"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    def _get_current_timestamp(self) -> int:
+        """Get current time as integer nanoseconds since the epoch"""
+        return time.time_ns()
 
     def get_config_directory(self) -> Path:
         """Get configuration directory path"""
@@ -318,8 +554,6 @@ class ConfigurationService:
 
     def backup_config(self, backup_name: Optional[str] = None) -> str:
         """Create a backup of all configuration files"""
-        import shutil
-        from datetime import datetime
 
         if not backup_name:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -328,10 +562,13 @@ class ConfigurationService:
         backup_dir = self.config_dir / "backups" / backup_name
         backup_dir.mkdir(parents=True, exist_ok=True)
 
+        # Back up the current settings, not what was last written
+        self.flush()
+
         # Copy configuration files
         for config_file in [self.audio_config_file, self.ui_config_file, self.app_config_file]:
             if config_file.exists():
-                shutil.copy2(config_file, backup_dir)
+                self._copy_config_file(config_file, backup_dir / config_file.name)
 
         return str(backup_dir)
 
@@ -342,25 +579,23 @@ class ConfigurationService:
         if not backup_dir.exists():
             return False
 
+        # Pending changes would overwrite the restored files
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty.clear()
+            self._loaded.clear()
+            self._views.clear()
+
         try:
             # Restore configuration files
             for config_file in [self.audio_config_file, self.ui_config_file, self.app_config_file]:
                 backup_file = backup_dir / config_file.name
                 if backup_file.exists():
-                    import shutil
-                    shutil.copy2(backup_file, config_file)
-
-            # Reload configurations
-            self._audio_config = self._load_or_create_config(
-                self.audio_config_file, self._default_audio_config
-            )
-            self._ui_config = self._load_or_create_config(
-                self.ui_config_file, self._default_ui_config
-            )
-            self._app_config = self._load_or_create_config(
-                self.app_config_file, self._default_app_config
-            )
+                    self._copy_config_file(backup_file, config_file)
 
+            # Restored configurations are read back on next access
             return True
 
         except Exception as e:
@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 
 from ..models.effects_chain import EffectsChain
@@ -11,6 +12,11 @@ class EffectsManager:
     def __init__(self):
         self._current_chain: Optional[EffectsChain] = None
         self._chains: Dict[UUID, EffectsChain] = {}
+        # Chain each known effect was last seen in; verified on lookup since
+        # chains can also be changed or registered without going through here
+        self._effect_index: Dict[UUID, EffectsChain] = {}
+        # (key, stats) from the last get_effects_statistics call
+        self._stats_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
 
         # Create default empty chain
         self._current_chain = EffectsChain("Default Chain")
@@ -49,11 +55,10 @@ class EffectsManager:
 
     def update_chain(self, chain_id: UUID, update_config: Dict[str, Any]) -> EffectsChain:
         """Update an existing effects chain"""
-        if chain_id not in self._chains:
+        chain = self._chains.get(chain_id)
+        if chain is None:
             raise ValueError("Effects chain not found")
 
-        chain = self._chains[chain_id]
-
         # Update name if provided
         if "name" in update_config:
             chain.name = update_config["name"]
@@ -69,16 +74,17 @@ class EffectsManager:
 
     def add_effect_to_chain(self, chain_id: UUID, effect_config: Dict[str, Any]) -> AudioEffect:
         """Add a new effect to the specified effects chain"""
-        if chain_id not in self._chains:
+        chain = self._chains.get(chain_id)
+        if chain is None:
             raise ValueError("Effects chain not found")
 
         if "type" not in effect_config:
             raise ValueError("Invalid effect configuration: missing type")
 
         try:
-            chain = self._chains[chain_id]
             effect = self._create_effect_from_config(effect_config)
             chain.add_effect(effect)
+            self._effect_index[effect.id] = chain
             return effect
 
         except Exception as e:
@@ -86,25 +92,32 @@ class EffectsManager:
 
     def remove_effect_from_chain(self, chain_id: UUID, effect_id: UUID) -> None:
         """Remove an effect from the effects chain"""
-        if chain_id not in self._chains:
+        chain = self._chains.get(chain_id)
+        if chain is None:
             raise ValueError("Effect or chain not found")
 
-        chain = self._chains[chain_id]
         if not chain.remove_effect(effect_id):
             raise ValueError("Effect or chain not found")
+        self._effect_index.pop(effect_id, None)
 
     def reorder_effects(self, chain_id: UUID, reorder_config: Dict[str, Any]) -> EffectsChain:
         """Reorder effects in the chain"""
-        if chain_id not in self._chains:
+        chain = self._chains.get(chain_id)
+        if chain is None:
             raise ValueError("Effects chain not found")
 
         if "effect_ids" not in reorder_config:
             raise ValueError("Invalid reorder configuration: missing effect_ids")
 
         try:
-            chain = self._chains[chain_id]
-            effect_ids = [UUID(id_str) if isinstance(id_str, str) else id_str
-                         for id_str in reorder_config["effect_ids"]]
+            id_values = reorder_config["effect_ids"]
+            try:
+                # Payloads are normally all strings; convert them in one C-level pass
+                effect_ids = list(map(UUID, id_values))
+            except (TypeError, AttributeError):
+                # Mixed payload, e.g. UUID objects passed in directly
+                effect_ids = [UUID(id_str) if isinstance(id_str, str) else id_str
+                              for id_str in id_values]
             chain.reorder_effects(effect_ids)
             return chain
 
@@ -164,15 +177,18 @@ class EffectsManager:
                 self._current_chain = EffectsChain("Default Chain")
                 self._chains[self._current_chain.id] = self._current_chain
 
-        del self._chains[chain_id]
+        chain = self._chains.pop(chain_id)
+        for effect in chain.effects:
+            self._effect_index.pop(effect.id, None)
         return True
 
     def set_current_chain(self, chain_id: UUID) -> bool:
         """Set the current active chain"""
-        if chain_id not in self._chains:
+        chain = self._chains.get(chain_id)
+        if chain is None:
             return False
 
-        self._current_chain = self._chains[chain_id]
+        self._current_chain = chain
         return True
 
     def get_all_chains(self) -> List[EffectsChain]:
@@ -183,6 +199,7 @@ class EffectsManager:
         """Create an effect from config and add to chain"""
         effect = self._create_effect_from_config(effect_config)
         chain.add_effect(effect)
+        self._effect_index[effect.id] = chain
 
     def _create_effect_from_config(self, effect_config: Dict[str, Any]) -> AudioEffect:
         """Create an AudioEffect from configuration dictionary"""
@@ -205,29 +222,48 @@ class EffectsManager:
 
     def _find_effect_by_id(self, effect_id: UUID) -> Optional[AudioEffect]:
         """Find an effect by ID across all chains"""
+        chain = self._effect_index.get(effect_id)
+        if chain is not None and self._chains.get(chain.id) is chain:
+            effect = chain.get_effect_by_id(effect_id)
+            if effect:
+                return effect
+
+        # Not indexed or moved since: scan, and remember where it was found
         for chain in self._chains.values():
             effect = chain.get_effect_by_id(effect_id)
             if effect:
+                self._effect_index[effect_id] = chain
                 return effect
+
+        self._effect_index.pop(effect_id, None)
         return None
 
     def get_effects_statistics(self) -> Dict[str, Any]:
         """Get statistics about current effects usage"""
         current_chain = self.get_current_chain()
 
+        # The chain version covers effect and bypass changes; name and chain
+        # count can change without it
+        key = (current_chain.id, current_chain.version, current_chain.name, len(self._chains))
+        if self._stats_cache is not None and self._stats_cache[0] == key:
+            return self._copy_stats(self._stats_cache[1])
+
         stats = {
             "total_chains": len(self._chains),
             "current_chain_name": current_chain.name,
             "current_chain_effects": len(current_chain.effects),
             "current_chain_active_effects": current_chain.get_active_effects_count(),
-            "effect_types_in_current_chain": {}
+            "effect_types_in_current_chain": dict(
+                Counter(effect.type.value for effect in current_chain.effects)
+            )
         }
 
-        # Count effect types in current chain
-        for effect in current_chain.effects:
-            effect_type = effect.type.value
-            if effect_type not in stats["effect_types_in_current_chain"]:
-                stats["effect_types_in_current_chain"][effect_type] = 0
-            stats["effect_types_in_current_chain"][effect_type] += 1
+        self._stats_cache = (key, stats)
+        return self._copy_stats(stats)
 
-        return stats
\ No newline at end of file
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy cached statistics so callers can't modify the cache"""
+        copied = dict(stats)
+        copied["effect_types_in_current_chain"] = dict(stats["effect_types_in_current_chain"])
+        return copied
\ No newline at end of file
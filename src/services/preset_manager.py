@@ -1,12 +1,24 @@
-import json
+import heapq
+import io
+import logging
 import os
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, TypeVar
 from uuid import UUID, uuid4
 from pathlib import Path
 
+from .. import _json
 from ..models.preset import Preset
 from ..models.effects_chain import EffectsChain
 
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Below this many preset files, loads and import writes run on the calling thread
+_PARALLEL_IO_MIN_FILES = 8
+
 
 class PresetManager:
     """Service for saving, loading, and managing effect chain presets"""
@@ -23,19 +35,46 @@ class PresetManager:
 
         # In-memory preset storage for quick access
         self._presets: Dict[UUID, Preset] = {}
-        self._preset_names: Dict[str, UUID] = {}  # For name uniqueness checking
+        # Case-folded name -> id, for case-insensitive name uniqueness checking
+        self._preset_names_ci: Dict[str, UUID] = {}
+        # (preset, summary) pairs sorted by name; rebuilt after any change
+        self._summary_cache: Optional[List[Tuple[Preset, int, Dict[str, Any]]]] = None
 
         # Load existing presets
         self._load_all_presets()
 
-    def list_presets(self, tags: Optional[List[str]] = None, search: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all presets with optional filtering"""
-        preset_summaries = []
+    def list_presets(self, tags: Optional[List[str]] = None, search: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List all presets with optional filtering
+
+        With limit, only the first limit presets by name are returned.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative")
+        if limit == 0:
+            return []
+
+        if not tags and not search:
+            if limit is not None and self._summary_cache is None:
+                # Cold cache: select the first names in O(N log k) rather
+                # than summarizing and sorting every preset
+                first = heapq.nsmallest(limit, self._presets.values(), key=lambda p: p.name.lower())
+                return [self._make_summary(preset) for preset in first]
 
-        for preset in self._presets.values():
+            summaries = self._get_summaries()
+            if limit is not None:
+                summaries = summaries[:limit]
+            return [self._copy_summary(summary) for _, _, summary in summaries]
+
+        summaries = self._get_summaries()
+
+        wanted_tags = frozenset(tags) if tags else None
+
+        preset_summaries = []
+        for preset, _, summary in summaries:
             # Apply tag filter
-            if tags:
-                if not any(tag in preset.tags for tag in tags):
+            if wanted_tags:
+                if wanted_tags.isdisjoint(preset.tags):
                     continue
 
             # Apply search filter
@@ -43,19 +82,10 @@ class PresetManager:
                 if not preset.matches_search(search):
                     continue
 
-            # Create preset summary
-            summary = {
-                "id": str(preset.id),
-                "name": preset.name,
-                "description": preset.description,
-                "created_at": preset.created_at.isoformat(),
-                "tags": preset.tags.copy(),
-                "effect_count": preset.get_effect_count()
-            }
-            preset_summaries.append(summary)
+            preset_summaries.append(self._copy_summary(summary))
+            if limit is not None and len(preset_summaries) >= limit:
+                break
 
-        # Sort by name
-        preset_summaries.sort(key=lambda x: x["name"].lower())
         return preset_summaries
 
     def save_preset(self, preset_config: Dict[str, Any]) -> Preset:
@@ -87,7 +117,8 @@ class PresetManager:
 
             # Add to in-memory storage
             self._presets[preset.id] = preset
-            self._preset_names[preset.name] = preset.id
+            self._preset_names_ci[preset.name.casefold()] = preset.id
+            self._summary_cache = None
 
             return preset
 
@@ -96,39 +127,36 @@ class PresetManager:
 
     def get_preset(self, preset_id: UUID) -> Preset:
         """Get a preset by ID"""
-        if preset_id not in self._presets:
+        preset = self._presets.get(preset_id)
+        if preset is None:
             # Try to load from file
             preset = self._load_from_file(preset_id)
             if not preset:
                 raise ValueError("Preset not found")
-            return preset
 
-        return self._presets[preset_id]
+        return preset
 
     def update_preset(self, preset_id: UUID, update_config: Dict[str, Any]) -> Preset:
         """Update an existing preset"""
-        if preset_id not in self._presets:
+        preset = self._presets.get(preset_id)
+        if preset is None:
             raise ValueError("Preset not found")
 
-        preset = self._presets[preset_id]
-
         # Check for name conflict if name is being changed
         if "name" in update_config and update_config["name"] != preset.name:
             # Check if another preset has this name (excluding current preset)
-            existing_id = self._preset_names.get(update_config["name"])
+            existing_id = self._preset_names_ci.get(update_config["name"].casefold())
             if existing_id and existing_id != preset_id:
                 raise ValueError("Preset name already exists")
 
             # Update name mapping
-            del self._preset_names[preset.name]
-            self._preset_names[update_config["name"]] = preset_id
+            self._forget_name(preset)
+            self._preset_names_ci[update_config["name"].casefold()] = preset_id
 
         try:
-            # Add small delay to ensure modified time changes
-            import time
-            time.sleep(0.001)
-
-            # Update preset
+            # Update preset; drop summaries first since a failed update can
+            # still have applied some fields
+            self._summary_cache = None
             preset.update(
                 name=update_config.get("name"),
                 description=update_config.get("description"),
@@ -146,11 +174,10 @@ class PresetManager:
 
     def delete_preset(self, preset_id: UUID) -> bool:
         """Delete a preset"""
-        if preset_id not in self._presets:
+        preset = self._presets.get(preset_id)
+        if preset is None:
             raise ValueError("Preset not found")
 
-        preset = self._presets[preset_id]
-
         try:
             # Remove file
             preset_file = self.presets_dir / f"{preset_id}.json"
@@ -159,7 +186,8 @@ class PresetManager:
 
             # Remove from memory
             del self._presets[preset_id]
-            del self._preset_names[preset.name]
+            self._forget_name(preset)
+            self._summary_cache = None
 
             return True
 
@@ -171,7 +199,10 @@ class PresetManager:
         preset = self.get_preset(preset_id)
 
         try:
-            return preset.to_effects_chain()
+            chain = preset.to_effects_chain()
+            # Build the effects now so invalid configs fail the load
+            chain.materialize()
+            return chain
         except Exception as e:
             raise RuntimeError(f"Failed to load preset: {e}")
 
@@ -185,23 +216,32 @@ class PresetManager:
             raise ValueError("Only JSON format is currently supported")
 
         try:
-            presets_data = []
+            # Encode one preset at a time into the output buffer, so only the
+            # finished bytes and a single preset dict are alive at once
+            buf = io.BytesIO()
+            buf.write(b"[")
+            first = True
 
             for preset_id_str in export_config["preset_ids"]:
                 preset_id = UUID(preset_id_str) if isinstance(preset_id_str, str) else preset_id_str
-                if preset_id in self._presets:
-                    preset = self._presets[preset_id]
-                    presets_data.append(preset.to_dict())
+                preset = self._presets.get(preset_id)
+                if preset is not None:
+                    buf.write(b"\n" if first else b",\n")
+                    buf.write(_json.dumps(preset.to_dict(copy=False)))
+                    first = False
 
-            # Export as JSON
-            export_json = json.dumps(presets_data, indent=2)
-            return export_json.encode('utf-8')
+            buf.write(b"]" if first else b"\n]")
+            return buf.getvalue()
 
         except Exception as e:
             raise RuntimeError(f"Export failed: {e}")
 
     def import_presets(self, import_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Import presets from a file"""
+        """Import presets from a file
+
+        "file" may be the JSON document as bytes or str, or an already
+        parsed list of preset dicts, which is used without re-encoding.
+        """
         if "file" not in import_config:
             raise ValueError("Invalid import file: missing file data")
 
@@ -209,13 +249,11 @@ class PresetManager:
         overwrite_existing = import_config.get("overwrite_existing", False)
 
         try:
-            # Parse JSON data
-            if isinstance(file_data, bytes):
-                json_str = file_data.decode('utf-8')
+            # Parse JSON data (bytes or str); parsed data is taken as is
+            if isinstance(file_data, (bytes, bytearray, str)):
+                presets_data = _json.loads(file_data)
             else:
-                json_str = file_data
-
-            presets_data = json.loads(json_str)
+                presets_data = file_data
 
             if not isinstance(presets_data, list):
                 raise ValueError("Invalid file format: expected list of presets")
@@ -224,31 +262,54 @@ class PresetManager:
             skipped_count = 0
             errors = []
 
+            # Resolve every preset's ID first, keyed by folded name so later
+            # entries in the same file conflict with earlier ones
+            pending: Dict[str, Preset] = {}
             for preset_data in presets_data:
                 try:
                     # Create preset from imported data
                     imported_preset = Preset.from_dict(preset_data)
 
                     # Check for name conflicts
-                    if self._preset_name_exists(imported_preset.name) and not overwrite_existing:
-                        skipped_count += 1
-                        continue
+                    name_key = imported_preset.name.casefold()
+                    earlier = pending.get(name_key)
+                    existing_id = None
+                    if earlier is not None or self._preset_name_exists(imported_preset.name):
+                        if not overwrite_existing:
+                            skipped_count += 1
+                            continue
+                        if earlier is not None:
+                            # Superseded before it was written
+                            existing_id = earlier.id
+                            imported_count += 1
+                        else:
+                            existing_id = self._preset_names_ci.get(name_key)
+
+                    # Overwrite an existing preset in place under its ID, so its
+                    # file is replaced rather than deleted and recreated
+                    imported_preset.id = existing_id if existing_id is not None else uuid4()
+                    pending[name_key] = imported_preset
+
+                except Exception as e:
+                    errors.append(f"Failed to import preset '{preset_data.get('name', 'unknown')}': {e}")
 
-                    # If overwriting, remove existing preset
-                    if self._preset_name_exists(imported_preset.name) and overwrite_existing:
-                        existing_id = self._preset_names[imported_preset.name]
-                        self.delete_preset(existing_id)
+            # Write all files, then make the renames durable with one
+            # directory sync; only presets whose file was written are added
+            to_write = list(pending.items())
+            results = self._map_io(self._try_save_to_file, [preset for _, preset in to_write])
+            self._sync_presets_dir()
 
-                    # Generate new ID and save
-                    imported_preset.id = uuid4()
-                    self._save_to_file(imported_preset)
-                    self._presets[imported_preset.id] = imported_preset
-                    self._preset_names[imported_preset.name] = imported_preset.id
+            for (name_key, imported_preset), error in zip(to_write, results):
+                if error is not None:
+                    errors.append(f"Failed to import preset '{imported_preset.name}': {error}")
+                    continue
 
-                    imported_count += 1
+                self._presets[imported_preset.id] = imported_preset
+                self._preset_names_ci[name_key] = imported_preset.id
+                imported_count += 1
 
-                except Exception as e:
-                    errors.append(f"Failed to import preset '{preset_data.get('name', 'unknown')}': {e}")
+            if to_write:
+                self._summary_cache = None
 
             return {
                 "imported_count": imported_count,
@@ -256,7 +317,7 @@ class PresetManager:
                 "errors": errors
             }
 
-        except json.JSONDecodeError as e:
+        except _json.JSONDecodeError as e:
             raise ValueError(f"Invalid import file: invalid JSON format")
         except Exception as e:
             raise ValueError(f"Invalid import file: {e}")
@@ -264,33 +325,44 @@ class PresetManager:
     def _save_to_file(self, preset: Preset) -> None:
         """Save preset to file"""
         preset_file = self.presets_dir / f"{preset.id}.json"
+        tmp_file = preset_file.with_suffix(".json.tmp")
 
         try:
-            with open(preset_file, 'w', encoding='utf-8') as f:
-                f.write(preset.to_json())
+            # Encoded straight to UTF-8 bytes and renamed into place, so a
+            # failed write never truncates an existing preset
+            data = _json.dumps(preset.to_dict(copy=False))
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, preset_file)
         except Exception as e:
             raise IOError(f"Failed to save preset file: {e}")
 
     def _load_from_file(self, preset_id: UUID) -> Optional[Preset]:
         """Load preset from file"""
+        preset = self._read_preset_file(preset_id)
+        if preset:
+            # Add to memory cache
+            self._presets[preset.id] = preset
+            self._preset_names_ci[preset.name.casefold()] = preset.id
+            self._summary_cache = None
+
+        return preset
+
+    def _read_preset_file(self, preset_id: UUID) -> Optional[Preset]:
+        """Read and parse a preset file without touching shared state"""
         preset_file = self.presets_dir / f"{preset_id}.json"
 
         if not preset_file.exists():
             return None
 
         try:
-            with open(preset_file, 'r', encoding='utf-8') as f:
-                json_str = f.read()
-
-            preset = Preset.from_json(json_str)
-            # Add to memory cache
-            self._presets[preset.id] = preset
-            self._preset_names[preset.name] = preset.id
+            with open(preset_file, 'rb') as f:
+                data = _json.loads(f.read())
 
-            return preset
+            return Preset.from_dict(data)
 
         except Exception as e:
-            print(f"Error loading preset {preset_id}: {e}")
+            logger.warning("Error loading preset %s: %s", preset_id, e)
             return None
 
     def _load_all_presets(self) -> None:
@@ -298,16 +370,123 @@ class PresetManager:
         if not self.presets_dir.exists():
             return
 
-        for preset_file in self.presets_dir.glob("*.json"):
+        preset_ids = []
+        for entry in self._iter_preset_files():
             try:
-                preset_id = UUID(preset_file.stem)
-                self._load_from_file(preset_id)
+                preset_ids.append(UUID(entry.name[:-5]))
             except Exception as e:
-                print(f"Error loading preset file {preset_file}: {e}")
+                logger.warning("Error loading preset file %s: %s", entry.path, e)
+
+        # Results come back in submission order and are registered here on one thread
+        presets = self._map_io(self._read_preset_file, preset_ids)
+
+        for preset in presets:
+            if preset:
+                self._presets[preset.id] = preset
+                self._preset_names_ci[preset.name.casefold()] = preset.id
+        self._summary_cache = None
+
+    def _map_io(self, func: Callable[[_T], _R], items: Iterable[_T]) -> List[_R]:
+        """Apply a file I/O function to each item, in order, on a thread pool when worthwhile
+
+        File reads and writes release the GIL, so a pool overlaps them.
+        """
+        items = list(items)
+        if len(items) < _PARALLEL_IO_MIN_FILES:
+            return [func(item) for item in items]
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def _try_save_to_file(self, preset: Preset) -> Optional[Exception]:
+        """Save preset to file, returning the error instead of raising it"""
+        try:
+            self._save_to_file(preset)
+            return None
+        except Exception as e:
+            return e
+
+    def _sync_presets_dir(self) -> None:
+        """Flush the presets directory entries (e.g. renamed files) to disk"""
+        try:
+            fd = os.open(self.presets_dir, os.O_RDONLY)
+        except OSError:
+            # Directories cannot be opened on every platform (e.g. Windows)
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _get_summaries(self) -> List[Tuple[Preset, int, Dict[str, Any]]]:
+        """Get (preset, version, summary) entries sorted by name
+
+        Entries are rebuilt when the preset's version sequence has moved on,
+        so edits made through Preset.update are picked up as well.
+        """
+        summaries = self._summary_cache
+        if summaries is None:
+            summaries = [
+                (preset, preset._version_seq, self._make_summary(preset))
+                for preset in self._presets.values()
+            ]
+            resort = True
+        else:
+            resort = False
+            for i, (preset, version, summary) in enumerate(summaries):
+                if version != preset._version_seq:
+                    fresh = self._make_summary(preset)
+                    resort = resort or fresh["name"] != summary["name"]
+                    summaries[i] = (preset, preset._version_seq, fresh)
+
+        if resort:
+            # Sort by name
+            summaries.sort(key=lambda entry: entry[2]["name"].lower())
+            self._summary_cache = summaries
+
+        return summaries
+
+    @staticmethod
+    def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached summary so callers can't modify the cache"""
+        copied = summary.copy()
+        copied["tags"] = summary["tags"].copy()
+        return copied
+
+    def _make_summary(self, preset: Preset) -> Dict[str, Any]:
+        """Create the list_presets summary for a preset"""
+        return {
+            "id": str(preset.id),
+            "name": preset.name,
+            "description": preset.description,
+            "created_at": preset._get_created_iso(),
+            "tags": preset.tags.copy(),
+            "effect_count": preset.get_effect_count()
+        }
+
+    def _iter_preset_files(self) -> Iterator[os.DirEntry]:
+        """Yield directory entries for *.json files in the presets directory
+
+        scandir reports the entry type from the directory listing itself, so
+        no per-file stat or Path object is needed.
+        """
+        with os.scandir(self.presets_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                    yield entry
 
     def _preset_name_exists(self, name: str) -> bool:
-        """Check if a preset name already exists"""
-        return name in self._preset_names
+        """Check if a preset name already exists, ignoring case"""
+        return name.casefold() in self._preset_names_ci
+
+    def _forget_name(self, preset: Preset) -> None:
+        """Drop the name mapping for a preset if it still points at that preset"""
+        key = preset.name.casefold()
+        if self._preset_names_ci.get(key) == preset.id:
+            del self._preset_names_ci[key]
 
     def _get_preset_by_id(self, preset_id: UUID) -> Optional[Preset]:
         """Internal method to get preset by ID (for testing)"""
@@ -326,14 +505,15 @@ class PresetManager:
         count = len(self._presets)
 
         # Remove all files
-        for preset_file in self.presets_dir.glob("*.json"):
+        for entry in self._iter_preset_files():
             try:
-                preset_file.unlink()
+                os.unlink(entry.path)
             except Exception:
                 pass
 
         # Clear memory
         self._presets.clear()
-        self._preset_names.clear()
+        self._preset_names_ci.clear()
+        self._summary_cache = None
 
         return count
\ No newline at end of file
@@ -6,6 +6,13 @@ from PyQt6.QtCore import Qt
 from ..services.config_service import ConfigurationService
 from ..services.audio_engine import AudioEngine
 
+# Latency label style and suffix for each latency band
+_LATENCY_STYLES = {
+    "high": ("color: orange;", "High"),
+    "moderate": ("color: yellow;", "Moderate"),
+    "low": ("color: green;", "Low"),
+}
+
 
 class AudioSettingsDialog(QDialog):
     """Dialog for configuring audio settings"""
@@ -14,7 +21,9 @@ class AudioSettingsDialog(QDialog):
         super().__init__(parent)
         self.config_service = config_service
         self.audio_engine = audio_engine
-        self.original_config = config_service.get_audio_config()
+        self.original_config = config_service.get_audio_config_mutable()
+        self._devices = {}
+        self._last_latency_key = None
         self.init_ui()
 
     def init_ui(self):
@@ -31,6 +40,9 @@ class AudioSettingsDialog(QDialog):
 
         device_layout = QVBoxLayout(device_group)
 
+        # Enumerate devices once for both combo boxes
+        self._refresh_device_cache()
+
         # Input device
         input_layout = QHBoxLayout()
         input_layout.addWidget(QLabel("Input Device:"))
@@ -145,23 +157,28 @@ class AudioSettingsDialog(QDialog):
         # Update initial latency estimate
         self.update_latency_estimate()
 
+    def _refresh_device_cache(self):
+        """Query the audio engine for the available devices"""
+        self._devices = self.audio_engine.get_available_devices()
+
     def populate_input_devices(self):
         """Populate input device combo box"""
-        devices = self.audio_engine.get_available_devices()
         self.input_combo.clear()
-        self.input_combo.addItems(devices.get("input_devices", ["Default Input"]))
+        self.input_combo.addItems(self._devices.get("input_devices", ["Default Input"]))
 
     def populate_output_devices(self):
         """Populate output device combo box"""
-        devices = self.audio_engine.get_available_devices()
         self.output_combo.clear()
-        self.output_combo.addItems(devices.get("output_devices", ["Default Output"]))
+        self.output_combo.addItems(self._devices.get("output_devices", ["Default Output"]))
 
     def refresh_devices(self):
         """Refresh the device lists"""
         current_input = self.input_combo.currentText()
         current_output = self.output_combo.currentText()
 
+        # Rescan the host, then fill both lists from the same result
+        self.audio_engine.refresh_devices()
+        self._refresh_device_cache()
         self.populate_input_devices()
         self.populate_output_devices()
 
@@ -228,26 +245,31 @@ class AudioSettingsDialog(QDialog):
         try:
             sample_rate = int(self.sample_rate_combo.currentText())
             buffer_size = int(self.buffer_size_combo.currentText())
-
-            # Calculate theoretical latency
-            latency_ms = (buffer_size / sample_rate) * 1000
-
-            self.latency_label.setText(f"Estimated latency: {latency_ms:.1f} ms")
-
-            # Add warning for high latency
-            if latency_ms > 20:
-                self.latency_label.setStyleSheet("color: orange;")
-                self.latency_label.setText(f"Estimated latency: {latency_ms:.1f} ms (High)")
-            elif latency_ms > 10:
-                self.latency_label.setStyleSheet("color: yellow;")
-                self.latency_label.setText(f"Estimated latency: {latency_ms:.1f} ms (Moderate)")
-            else:
-                self.latency_label.setStyleSheet("color: green;")
-                self.latency_label.setText(f"Estimated latency: {latency_ms:.1f} ms (Low)")
-
         except ValueError:
+            self._last_latency_key = None
             self.latency_label.setText("Estimated latency: -- ms")
             self.latency_label.setStyleSheet("")
+            return
+
+        # Restyling the label makes Qt recompute its style, so skip repeats
+        key = (sample_rate, buffer_size)
+        if key == self._last_latency_key:
+            return
+        self._last_latency_key = key
+
+        # Calculate theoretical latency
+        latency_ms = (buffer_size / sample_rate) * 1000
+
+        # Add warning for high latency
+        if latency_ms > 20:
+            style, level = _LATENCY_STYLES["high"]
+        elif latency_ms > 10:
+            style, level = _LATENCY_STYLES["moderate"]
+        else:
+            style, level = _LATENCY_STYLES["low"]
+
+        self.latency_label.setStyleSheet(style)
+        self.latency_label.setText(f"Estimated latency: {latency_ms:.1f} ms ({level})")
 
     def apply_settings(self):
         """Apply settings without closing dialog"""
@@ -1,41 +1,51 @@
+import traceback
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QSlider, QPushButton, QCheckBox, QGroupBox,
-                             QScrollArea, QFrame, QComboBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+                             QScrollArea, QFrame, QComboBox, QMessageBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QEvent
 from PyQt6.QtGui import QFont
 
 from ..models.audio_effect import EffectType
 from ..services.effects_manager import EffectsManager
 from ..services.audio_engine import AudioEngine
 
+_EFFECT_TYPE_VALUES = tuple(effect_type.value for effect_type in EffectType)
+_EFFECT_TYPE_BY_VALUE = {effect_type.value: effect_type for effect_type in EffectType}
+
 
 class EffectWidget(QWidget):
     """Widget for controlling a single effect"""
 
-    parameter_changed = pyqtSignal(str, str, float)  # effect_id, param_name, value
-    bypass_toggled = pyqtSignal(str, bool)  # effect_id, bypassed
-    remove_requested = pyqtSignal(str)  # effect_id
+    parameter_changed = pyqtSignal(object, str, float)  # effect_id (UUID), param_name, value
+    bypass_toggled = pyqtSignal(object, bool)  # effect_id (UUID), bypassed
+    remove_requested = pyqtSignal(object)  # effect_id (UUID)
 
     def __init__(self, effect, parent=None):
         super().__init__(parent)
         self.effect = effect
         self.parameter_sliders = {}
-        self.updating_ui = False
+        self._param_meta = {}
+        self._slider_index = {}
+        self._last_bypass_styled = None
 
-        # Timer for delayed signal emission
-        self.signal_timer = QTimer()
-        self.signal_timer.setSingleShot(True)
-        self.signal_timer.timeout.connect(self._emit_delayed_signal)
-        self.pending_bypass_state = None
+        # Per-parameter debounce timers so a slider drag reaches the audio
+        # engine as one update instead of one per tick
+        self._param_timers = {}
+        self._pending_param_values = {}
 
         self.init_ui()
 
     def init_ui(self):
         """Initialize the effect widget UI"""
+        # Build all children before the first layout/paint pass
+        self.setUpdatesEnabled(False)
+
         layout = QVBoxLayout(self)
 
         # Create group box for effect
         self.group_box = QGroupBox(self.effect.type.value)
+        self.group_box.setObjectName("effectBox")
         layout.addWidget(self.group_box)
 
         group_layout = QVBoxLayout(self.group_box)
@@ -65,6 +75,8 @@ class EffectWidget(QWidget):
         # Update initial state
         self.update_bypass_state()
 
+        self.setUpdatesEnabled(True)
+
     def create_parameter_controls(self, layout):
         """Create parameter control sliders"""
         param_info = self.effect.get_all_parameter_info()
@@ -93,7 +105,18 @@ class EffectWidget(QWidget):
             self.parameter_sliders[param_name] = checkbox
         else:
             # Numeric parameter - use slider
-            label = QLabel(f"{param_name.replace('_', ' ').title()}: {value:.2f}{unit_str}")
+            min_val = param_info["min_value"]
+            max_val = param_info["max_value"]
+            meta = {
+                "min": min_val,
+                "max": max_val,
+                "range": (max_val - min_val) or 1.0,
+                "label_tpl": f"{param_name.replace('_', ' ').title()}: {{:.2f}}{unit_str}",
+            }
+            self._param_meta[param_name] = meta
+
+            label = QLabel(meta["label_tpl"].format(value))
+            meta["label"] = label
             layout.addWidget(label)
 
             slider = QSlider(Qt.Orientation.Horizontal)
@@ -101,66 +124,70 @@ class EffectWidget(QWidget):
             slider.setMaximum(1000)  # Use 1000 steps for precision
 
             # Set current value
-            min_val = param_info["min_value"]
-            max_val = param_info["max_value"]
-            normalized_value = (value - min_val) / (max_val - min_val) if max_val > min_val else 0
+            normalized_value = (value - min_val) / meta["range"] if max_val > min_val else 0
             slider.setValue(int(normalized_value * 1000))
 
-            slider.valueChanged.connect(
-                lambda val, name=param_name, min_v=min_val, max_v=max_val, lbl=label, unit=unit_str:
-                self.on_slider_changed(name, val, min_v, max_v, lbl, unit)
-            )
+            # All sliders share one slot; sender() identifies the parameter
+            self._slider_index[slider] = param_name
+            slider.valueChanged.connect(self._on_any_slider_changed)
 
             layout.addWidget(slider)
             self.parameter_sliders[param_name] = (slider, label)
 
         return layout
 
-    def on_slider_changed(self, param_name, slider_value, min_val, max_val, label, unit_str):
-        """Handle slider value change"""
-        if self.updating_ui:
-            return
+    def _on_any_slider_changed(self, slider_value):
+        """Dispatch a slider change to its parameter"""
+        param_name = self._slider_index.get(self.sender())
+        if param_name is not None:
+            self.on_slider_changed(param_name, slider_value)
 
+    def on_slider_changed(self, param_name, slider_value):
+        """Handle slider value change"""
         # Convert slider value to parameter value
+        meta = self._param_meta[param_name]
         normalized = slider_value / 1000.0
-        param_value = min_val + normalized * (max_val - min_val)
+        param_value = meta["min"] + normalized * (meta["max"] - meta["min"])
 
         # Update label
-        label.setText(f"{param_name.replace('_', ' ').title()}: {param_value:.2f}{unit_str}")
-
-        # Emit signal
-        self.parameter_changed.emit(str(self.effect.id), param_name, param_value)
+        meta["label"].setText(meta["label_tpl"].format(param_value))
+
+        # Emit signal once the slider settles
+        self._pending_param_values[param_name] = param_value
+        timer = self._param_timers.get(param_name)
+        if timer is None:
+            timer = self._param_timers[param_name] = self._make_singleshot(param_name)
+        timer.start(50)
+
+    def _make_singleshot(self, param_name):
+        """Create the debounce timer for a parameter"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda name=param_name: self._emit_pending_parameter(name))
+        return timer
+
+    def _emit_pending_parameter(self, param_name):
+        """Emit the last value a parameter's slider was moved to"""
+        value = self._pending_param_values.pop(param_name, None)
+        if value is not None:
+            self.parameter_changed.emit(self.effect.id, param_name, value)
 
     def on_parameter_changed(self, param_name, value):
         """Handle parameter change"""
-        if self.updating_ui:
-            return
-
-        self.parameter_changed.emit(str(self.effect.id), param_name, value)
+        self.parameter_changed.emit(self.effect.id, param_name, value)
 
     def on_bypass_clicked(self):
         """Handle bypass button click"""
-        if self.updating_ui:
-            return
-
         # Update effect state immediately
         bypassed = self.bypass_button.isChecked()
         self.effect.set_bypassed(bypassed)
         self.update_bypass_state()
 
-        # Schedule delayed signal emission to prevent UI freezing
-        self.pending_bypass_state = bypassed
-        self.signal_timer.start(10)  # 10ms delay
-
-    def _emit_delayed_signal(self):
-        """Emit the bypass signal after a short delay"""
-        if self.pending_bypass_state is not None:
-            self.bypass_toggled.emit(str(self.effect.id), self.pending_bypass_state)
-            self.pending_bypass_state = None
+        self.bypass_toggled.emit(self.effect.id, bypassed)
 
     def on_remove_clicked(self):
         """Handle remove button click"""
-        self.remove_requested.emit(str(self.effect.id))
+        self.remove_requested.emit(self.effect.id)
 
     def update_bypass_state(self):
         """Update UI based on bypass state"""
@@ -172,49 +199,60 @@ class EffectWidget(QWidget):
         # DON'T disable the entire group box - just change visual appearance
         # self.group_box.setEnabled(not bypassed)  # This was causing the freeze!
 
-        # Visual indication of bypass
-        if bypassed:
-            self.group_box.setStyleSheet("QGroupBox { color: #888888; opacity: 0.6; }")
-            self.bypass_button.setStyleSheet("QPushButton { background-color: #ff6666; }")
-        else:
-            self.group_box.setStyleSheet("")
-            self.bypass_button.setStyleSheet("")
+        # Visual indication of bypass: the window stylesheet matches on these
+        # properties, so a state change only needs a re-polish
+        if bypassed == self._last_bypass_styled:
+            return
+        self._last_bypass_styled = bypassed
+
+        state = "true" if bypassed else "false"
+        for widget, prop in ((self.group_box, "bypassed"), (self.bypass_button, "bypassOn")):
+            widget.setProperty(prop, state)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
 
     def update_parameter_value(self, param_name, value):
         """Update parameter value in UI"""
-        self.updating_ui = True
-
         if param_name in self.parameter_sliders:
             control = self.parameter_sliders[param_name]
 
             if isinstance(control, QCheckBox):
                 # Boolean parameter
-                control.setChecked(bool(value))
+                with QSignalBlocker(control):
+                    control.setChecked(bool(value))
             else:
                 # Numeric parameter
                 slider, label = control
-                param_info = self.effect.get_parameter_info(param_name)
+                meta = self._param_meta[param_name]
 
-                min_val = param_info["min_value"]
-                max_val = param_info["max_value"]
-                units = param_info["units"]
-                unit_str = f" {units}" if units else ""
-
-                # Update slider
-                normalized_value = (value - min_val) / (max_val - min_val) if max_val > min_val else 0
-                slider.setValue(int(normalized_value * 1000))
+                # Update slider without echoing valueChanged back to us
+                min_val = meta["min"]
+                normalized_value = (value - min_val) / meta["range"] if meta["max"] > min_val else 0
+                with QSignalBlocker(slider):
+                    slider.setValue(int(normalized_value * 1000))
 
                 # Update label
-                label.setText(f"{param_name.replace('_', ' ').title()}: {value:.2f}{unit_str}")
-
-        self.updating_ui = False
+                label.setText(meta["label_tpl"].format(value))
 
     def update_bypass_button(self, bypassed):
         """Update bypass button state from external source"""
-        self.updating_ui = True
-        self.bypass_button.setChecked(bypassed)
+        with QSignalBlocker(self.bypass_button):
+            self.bypass_button.setChecked(bypassed)
         self.update_bypass_state()
-        self.updating_ui = False
+
+
+class _EffectPlaceholder(QFrame):
+    """Stand-in for an EffectWidget that has not been scrolled into view yet"""
+
+    # Rough EffectWidget height: header plus a label/slider row per parameter
+    _BASE_HEIGHT = 80
+    _ROW_HEIGHT = 50
+
+    def __init__(self, effect, parent=None):
+        super().__init__(parent)
+        self.effect = effect
+        self.setFixedHeight(self._BASE_HEIGHT + self._ROW_HEIGHT * len(effect.parameters))
 
 
 class EffectsPanel(QWidget):
@@ -227,6 +265,7 @@ class EffectsPanel(QWidget):
         self.effects_manager = effects_manager
         self.audio_engine = audio_engine
         self.effect_widgets = {}
+        self._materialized = set()  # ids whose entry is a real EffectWidget
         self.init_ui()
 
     def init_ui(self):
@@ -245,7 +284,7 @@ class EffectsPanel(QWidget):
         add_layout.addWidget(add_label)
 
         self.effect_combo = QComboBox()
-        self.effect_combo.addItems([effect_type.value for effect_type in EffectType])
+        self.effect_combo.addItems(_EFFECT_TYPE_VALUES)
         add_layout.addWidget(self.effect_combo)
 
         add_button = QPushButton("Add")
@@ -275,13 +314,20 @@ class EffectsPanel(QWidget):
         self.scroll_area.setWidget(self.effects_container)
         layout.addWidget(self.scroll_area)
 
+        # Effects start as placeholders and get real widgets once visible
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._materialize_visible)
+        scroll_bar.rangeChanged.connect(self._materialize_visible)
+        self._viewport = self.scroll_area.viewport()
+        self._viewport.installEventFilter(self)
+
         # Load initial effects
         self.refresh_effects()
 
     def add_effect(self):
         """Add a new effect to the chain"""
         effect_type_str = self.effect_combo.currentText()
-        effect_type = EffectType(effect_type_str)
+        effect_type = _EFFECT_TYPE_BY_VALUE[effect_type_str]
 
         effect_config = {
             "type": effect_type_str,
@@ -295,38 +341,88 @@ class EffectsPanel(QWidget):
             self.effects_changed.emit()
 
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to add effect: {e}")
 
     def refresh_effects(self):
         """Refresh the effects display"""
-        # Clear existing widgets
-        for widget in self.effect_widgets.values():
-            widget.deleteLater()
-        self.effect_widgets.clear()
-
         # Get current effects chain
         current_chain = self.effects_manager.get_current_chain()
+        effects = {str(effect.id): effect for effect in current_chain.effects}
+
+        # Apply all widget changes in one paint
+        self.effects_container.setUpdatesEnabled(False)
+        try:
+            # Drop widgets whose effect left the chain (or was replaced, e.g. by a
+            # preset load); widgets for effects still present are kept as-is
+            for effect_id, widget in list(self.effect_widgets.items()):
+                if effects.get(effect_id) is not widget.effect:
+                    self.effects_layout.removeWidget(widget)
+                    widget.deleteLater()
+                    del self.effect_widgets[effect_id]
+                    self._materialized.discard(effect_id)
+
+            # Add placeholders for new effects and put every entry at its
+            # chain position
+            for index, (effect_id, effect) in enumerate(effects.items()):
+                widget = self.effect_widgets.get(effect_id)
+                if widget is None:
+                    widget = _EffectPlaceholder(effect, self.effects_container)
+                    self.effect_widgets[effect_id] = widget
+                elif self.effects_layout.indexOf(widget) == index:
+                    continue
+                else:
+                    self.effects_layout.removeWidget(widget)
+
+                # Insert ahead of the trailing stretch
+                self.effects_layout.insertWidget(index, widget)
+        finally:
+            self.effects_container.setUpdatesEnabled(True)
+
+        # Placeholder geometry is only known after the next layout pass
+        QTimer.singleShot(0, self._materialize_visible)
+
+    def _create_effect_widget(self, effect):
+        """Create an EffectWidget wired to this panel"""
+        widget = EffectWidget(effect, self)
+
+        # Connect signals
+        widget.parameter_changed.connect(self.on_parameter_changed)
+        widget.bypass_toggled.connect(self.on_bypass_toggled)
+        widget.remove_requested.connect(self.on_remove_effect)
+
+        return widget
+
+    def _materialize_visible(self, *_):
+        """Swap placeholders inside the scroll viewport for real EffectWidgets"""
+        if len(self._materialized) == len(self.effect_widgets):
+            return
+
+        # Viewport rect in container coordinates
+        visible = self._viewport.rect().translated(-self.effects_container.pos())
+
+        for effect_id, placeholder in list(self.effect_widgets.items()):
+            if effect_id in self._materialized or not placeholder.geometry().intersects(visible):
+                continue
 
-        # Create widgets for each effect
-        for effect in current_chain.effects:
-            widget = EffectWidget(effect, self)
+            index = self.effects_layout.indexOf(placeholder)
+            widget = self._create_effect_widget(placeholder.effect)
+            self.effects_layout.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.effects_layout.insertWidget(index, widget)
 
-            # Connect signals
-            widget.parameter_changed.connect(self.on_parameter_changed)
-            widget.bypass_toggled.connect(self.on_bypass_toggled)
-            widget.remove_requested.connect(self.on_remove_effect)
+            self.effect_widgets[effect_id] = widget
+            self._materialized.add(effect_id)
 
-            # Add to layout (insert before stretch)
-            self.effects_layout.insertWidget(self.effects_layout.count() - 1, widget)
-            self.effect_widgets[str(effect.id)] = widget
+    def eventFilter(self, obj, event):
+        """Materialize newly visible effects when the viewport is resized"""
+        if obj is self._viewport and event.type() == QEvent.Type.Resize:
+            self._materialize_visible()
+        return super().eventFilter(obj, event)
 
     def on_parameter_changed(self, effect_id, param_name, value):
         """Handle effect parameter change"""
         try:
-            from uuid import UUID
-            effect_uuid = UUID(effect_id)
-            self.effects_manager.update_effect_parameters(effect_uuid, {param_name: value})
+            self.effects_manager.update_effect_parameters(effect_id, {param_name: value})
             self.effects_changed.emit()
 
         except Exception as e:
@@ -341,19 +437,15 @@ class EffectsPanel(QWidget):
 
         except Exception as e:
             print(f"Error toggling bypass: {e}")
-            import traceback
             traceback.print_exc()
 
     def on_remove_effect(self, effect_id):
         """Handle effect removal"""
         try:
-            from uuid import UUID
-            effect_uuid = UUID(effect_id)
             current_chain = self.effects_manager.get_current_chain()
-            self.effects_manager.remove_effect_from_chain(current_chain.id, effect_uuid)
+            self.effects_manager.remove_effect_from_chain(current_chain.id, effect_id)
             self.refresh_effects()
             self.effects_changed.emit()
 
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to remove effect: {e}")
\ No newline at end of file
@@ -1,7 +1,8 @@
+import os
 import sys
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QMenuBar, QMenu, QStatusBar, QLabel, QPushButton,
-                             QApplication, QSplitter, QFrame)
+                             QApplication, QSplitter, QFrame, QMessageBox)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 
@@ -14,6 +15,76 @@ from ..services.preset_manager import PresetManager
 from ..services.config_service import ConfigurationService
 
 
+DARK_STYLE = """
+QMainWindow {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QFrame {
+    border: 1px solid #555555;
+}
+QPushButton {
+    background-color: #404040;
+    border: 2px solid #606060;
+    border-radius: 4px;
+    padding: 6px;
+    min-width: 80px;
+}
+QPushButton:hover {
+    background-color: #505050;
+    border-color: #707070;
+}
+QPushButton:pressed {
+    background-color: #353535;
+}
+QMenuBar {
+    background-color: #2b2b2b;
+    border-bottom: 1px solid #555555;
+}
+QMenuBar::item {
+    background-color: transparent;
+    padding: 4px 8px;
+}
+QMenuBar::item:selected {
+    background-color: #404040;
+}
+QStatusBar {
+    background-color: #2b2b2b;
+    border-top: 1px solid #555555;
+}
+QSlider::groove:horizontal {
+    border: 1px solid #555555;
+    height: 6px;
+    background: #404040;
+    border-radius: 3px;
+}
+QSlider::handle:horizontal {
+    background: #808080;
+    border: 1px solid #606060;
+    width: 18px;
+    margin: -6px 0;
+    border-radius: 9px;
+}
+QSlider::handle:horizontal:hover {
+    background: #909090;
+}
+"""
+
+# Bypass styling for effect widgets, applied whatever the theme
+BYPASS_STYLE = """
+QGroupBox#effectBox[bypassed="true"] {
+    color: #888888;
+}
+QPushButton[bypassOn="true"] {
+    background-color: #ff6666;
+}
+"""
+
+
 class MainWindow(QMainWindow):
     """Main application window with PyQt6"""
 
@@ -28,6 +99,10 @@ class MainWindow(QMainWindow):
         self.preset_manager = PresetManager()
         self.config_service = ConfigurationService()
 
+        # Chain debug printing is opt-in via PEDAL_DEBUG
+        self._debug_effects = bool(os.environ.get("PEDAL_DEBUG"))
+        self._last_effects_debug = ""
+
         # UI Components
         self.effects_panel = None
         self.preset_browser = None
@@ -37,6 +112,12 @@ class MainWindow(QMainWindow):
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self.update_status)
 
+        # Coalesces bursts of effects changes into one chain update
+        self._chain_dirty_timer = QTimer(self)
+        self._chain_dirty_timer.setSingleShot(True)
+        self._chain_dirty_timer.setInterval(30)
+        self._chain_dirty_timer.timeout.connect(self._flush_chain)
+
         # Initialize UI
         self.init_ui()
         self.setup_connections()
@@ -156,6 +237,10 @@ class MainWindow(QMainWindow):
         self.status_bar.addPermanentWidget(self.latency_label)
         self.status_bar.addPermanentWidget(self.cpu_label)
 
+        # Last text shown, so polling only repaints labels that changed
+        self._last_latency_text = None
+        self._last_cpu_text = None
+
     def setup_connections(self):
         """Setup signal connections between components"""
         # Connect effects panel signals
@@ -174,66 +259,9 @@ class MainWindow(QMainWindow):
         """Apply dark theme to the application"""
         theme = self.config_service.get_theme()
 
-        if theme == "dark":
-            dark_style = """
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QFrame {
-                border: 1px solid #555555;
-            }
-            QPushButton {
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 4px;
-                padding: 6px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #707070;
-            }
-            QPushButton:pressed {
-                background-color: #353535;
-            }
-            QMenuBar {
-                background-color: #2b2b2b;
-                border-bottom: 1px solid #555555;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 4px 8px;
-            }
-            QMenuBar::item:selected {
-                background-color: #404040;
-            }
-            QStatusBar {
-                background-color: #2b2b2b;
-                border-top: 1px solid #555555;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #555555;
-                height: 6px;
-                background: #404040;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #808080;
-                border: 1px solid #606060;
-                width: 18px;
-                margin: -6px 0;
-                border-radius: 9px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #909090;
-            }
-            """
-            self.setStyleSheet(dark_style)
+        style = DARK_STYLE + BYPASS_STYLE if theme == "dark" else BYPASS_STYLE
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
 
     def new_preset(self):
         """Create a new preset"""
@@ -295,8 +323,6 @@ class MainWindow(QMainWindow):
 
     def show_about(self):
         """Show about dialog"""
-        from PyQt6.QtWidgets import QMessageBox
-
         QMessageBox.about(
             self,
             "About Pedalboard Effects",
@@ -308,27 +334,27 @@ class MainWindow(QMainWindow):
 
     def show_error(self, message: str):
         """Show error message"""
-        from PyQt6.QtWidgets import QMessageBox
-
         QMessageBox.critical(self, "Error", message)
 
     def on_effects_changed(self):
         """Handle effects chain changes"""
+        self._chain_dirty_timer.start()
+
+    def _flush_chain(self):
+        """Push the current effects chain to the audio engine"""
         # Update audio engine with new effects chain
         current_chain = self.effects_manager.get_current_chain()
         self.audio_engine.set_effects_chain(current_chain)
 
         # Debug info (throttled)
-        if not hasattr(self, '_last_effects_debug'):
-            self._last_effects_debug = ""
+        if __debug__ and self._debug_effects:
+            active_effects = [f"{e.type.value}{'(bypassed)' if e.bypassed else ''}"
+                             for e in current_chain.effects]
+            effects_str = str(active_effects)
 
-        active_effects = [f"{e.type.value}{'(bypassed)' if e.bypassed else ''}"
-                         for e in current_chain.effects]
-        effects_str = str(active_effects)
-
-        if effects_str != self._last_effects_debug:
-            print(f"Effects chain updated: {active_effects}")
-            self._last_effects_debug = effects_str
+            if effects_str != self._last_effects_debug:
+                print(f"Effects chain updated: {active_effects}")
+                self._last_effects_debug = effects_str
 
     def on_preset_loaded(self, preset_name: str):
         """Handle preset loaded"""
@@ -350,11 +376,22 @@ class MainWindow(QMainWindow):
 
             # Update latency
             latency = status.get("latency_ms", 0)
-            self.latency_label.setText(f"Latency: {latency:.1f} ms")
+            latency_text = f"Latency: {latency:.1f} ms"
+            if latency_text != self._last_latency_text:
+                self.latency_label.setText(latency_text)
+                self._last_latency_text = latency_text
 
             # Update CPU usage
             cpu = status.get("cpu_usage", 0)
-            self.cpu_label.setText(f"CPU: {cpu:.0f}%")
+            cpu_text = f"CPU: {cpu:.0f}%"
+            if cpu_text != self._last_cpu_text:
+                self.cpu_label.setText(cpu_text)
+                self._last_cpu_text = cpu_text
+
+            # Poll less often while audio is stopped
+            interval = 100 if status.get("active") else 250
+            if self.status_timer.interval() != interval:
+                self.status_timer.setInterval(interval)
 
         except Exception:
             pass  # Ignore status update errors
@@ -393,6 +430,7 @@ class MainWindow(QMainWindow):
 
         # Save window geometry
         self.save_window_geometry()
+        self.config_service.close()
 
         # Accept close event
         event.accept()
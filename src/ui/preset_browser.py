@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QListWidget, QListWidgetItem, QPushButton,
                              QLineEdit, QTextEdit, QInputDialog, QMessageBox,
@@ -207,7 +209,6 @@ class PresetBrowser(QWidget):
         preset_data = current_item.data(Qt.ItemDataRole.UserRole)
 
         try:
-            from uuid import UUID
             preset_id = UUID(preset_data["id"])
 
             # Load preset into effects manager
@@ -315,7 +316,6 @@ class PresetBrowser(QWidget):
             return
 
         try:
-            from uuid import UUID
             preset_id = UUID(preset_data["id"])
 
             # Update preset
@@ -356,7 +356,6 @@ class PresetBrowser(QWidget):
             return
 
         try:
-            from uuid import UUID
             preset_id = UUID(preset_data["id"])
 
             # Delete preset
@@ -1,6 +1,10 @@
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch
+from src.services import audio_engine as audio_engine_module
 from src.services.audio_engine import AudioEngine
+from src.models.effects_chain import EffectsChain
+from src.models.audio_effect import AudioEffect, EffectType
 
 
 class TestAudioProcessingContract:
@@ -60,6 +64,27 @@ class TestAudioProcessingContract:
         with pytest.raises(ValueError, match="Invalid audio configuration"):
             audio_engine.start_processing(incomplete_config)
 
+    def test_start_audio_processing_invalid_tuning_options(self):
+        """Test validation of the optional stream tuning settings"""
+        audio_engine = AudioEngine()
+
+        base_config = {
+            "input_device": "Scarlett 2i2 USB",
+            "output_device": "BlackHole 2ch",
+            "sample_rate": 48000,
+            "buffer_size": 256
+        }
+
+        options = (
+            {"ring_buffer_blocks": -1},
+            {"realtime_priority": "yes"},
+            {"cpu_core": -1},
+            {"sample_format": "int24"}
+        )
+        for option in options:
+            with pytest.raises(ValueError, match="Invalid audio configuration"):
+                audio_engine.start_processing({**base_config, **option})
+
     def test_stop_audio_processing_contract(self):
         """Test audio processing stop contract"""
         audio_engine = AudioEngine()
@@ -113,6 +138,198 @@ class TestAudioProcessingContract:
             assert len(result["samples"][0]) == 3  # 3 samples per channel
             assert result["timestamp"] == audio_frame["timestamp"]
 
+    def test_process_audio_frame_ndarray_contract(self):
+        """Test that ndarray frames are processed and returned as ndarrays"""
+        audio_engine = AudioEngine()
+
+        audio_frame = {
+            "samples": np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32),
+            "channels": 2,
+            "sample_rate": 48000,
+            "timestamp": 1234567890.123
+        }
+
+        result = audio_engine.process_frame(audio_frame)
+
+        assert isinstance(result["samples"], np.ndarray)
+        assert result["samples"].shape == (2, 3)
+        assert result["channels"] == 2
+        assert result["timestamp"] == audio_frame["timestamp"]
+
+    def test_process_frame_inplace_contract(self):
+        """Test in-place processing into a caller-owned output buffer"""
+        audio_engine = AudioEngine()
+
+        indata = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32)
+        outdata = np.zeros_like(indata)
+
+        # Without an effects chain the block is copied through unchanged
+        result = audio_engine.process_frame_inplace(indata, outdata, 48000)
+
+        assert result is None
+        np.testing.assert_array_equal(outdata, indata)
+
+    def test_process_frames_batch_contract(self):
+        """Test batch processing returns one result per input frame"""
+        audio_engine = AudioEngine()
+
+        audio_frames = [
+            {
+                "samples": [[0.1 * i, 0.2 * i], [0.3 * i, 0.4 * i]],
+                "channels": 2,
+                "sample_rate": 48000,
+                "timestamp": float(i)
+            }
+            for i in range(3)
+        ]
+
+        results = audio_engine.process_frames(audio_frames)
+
+        assert len(results) == 3
+        for audio_frame, result in zip(audio_frames, results):
+            assert result["samples"] == audio_frame["samples"]
+            assert result["channels"] == 2
+            assert result["timestamp"] == audio_frame["timestamp"]
+
+        mixed_frames = [audio_frames[0], {"samples": [[0.1, 0.2]], "channels": 1, "sample_rate": 48000}]
+        with pytest.raises(ValueError, match="Invalid audio frame data"):
+            audio_engine.process_frames(mixed_frames)
+
+    def test_process_frames_matches_stream_processing(self):
+        """Test batch processing with a real chain matches processing the stream in order"""
+        audio_config = {
+            "input_device": "Scarlett 2i2 USB",
+            "output_device": "BlackHole 2ch",
+            "sample_rate": 48000,
+            "buffer_size": 256,
+            "input_channels": [0],
+            "output_channels": [0, 1]
+        }
+
+        def make_engine():
+            audio_engine = AudioEngine()
+            with patch.object(audio_engine, '_initialize_audio_stream'):
+                audio_engine.start_processing(audio_config)
+            chain = EffectsChain(name="Batch Chain")
+            chain.add_effect(AudioEffect(EffectType.BOOST, {"gain_db": 6.0}))
+            chain.add_effect(AudioEffect(EffectType.DELAY, {"delay_seconds": 0.001, "feedback": 0.5, "mix": 0.5}))
+            audio_engine.set_effects_chain(chain)
+            return audio_engine
+
+        rng = np.random.default_rng(0)
+        for sizes in ([256, 256, 256], [100, 300, 57]):
+            blocks = [rng.uniform(-0.5, 0.5, (2, n)).astype(np.float32) for n in sizes]
+            frames = [{"samples": block, "channels": 2, "sample_rate": 48000} for block in blocks]
+
+            results = make_engine().process_frames(frames)
+            assert [result["samples"].shape for result in results] == [block.shape for block in blocks]
+
+            # Same output as running the whole stream through in one go
+            whole = make_engine().process_frame(
+                {"samples": np.concatenate(blocks, axis=1), "channels": 2, "sample_rate": 48000}
+            )["samples"]
+            np.testing.assert_allclose(
+                np.concatenate([result["samples"] for result in results], axis=1), whole, atol=1e-6
+            )
+
+            # The delay tail carries across frames instead of restarting
+            isolated = make_engine().process_frame(frames[1])["samples"]
+            assert not np.allclose(results[1]["samples"], isolated, atol=1e-6)
+
+            if len(set(sizes)) == 1:
+                # Equal blocks also match streaming the frames one call at a time
+                streaming_engine = make_engine()
+                for block, result in zip(blocks, results):
+                    outdata = np.empty_like(block)
+                    streaming_engine.process_frame_inplace(block, outdata, 48000)
+                    np.testing.assert_allclose(result["samples"], outdata, atol=1e-6)
+
+    @pytest.mark.skipif(not audio_engine_module.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_fused_stages_match_pedalboard(self):
+        """Test the fused gain/distortion kernel matches the equivalent pedalboard chain"""
+        import pedalboard
+
+        effects = [
+            AudioEffect(EffectType.BOOST, {"gain_db": 6.0}),
+            AudioEffect(EffectType.DISTORTION, {"drive_db": 12.0}),
+            AudioEffect(EffectType.BOOST, {"gain_db": -3.0}),
+        ]
+        board = pedalboard.Pedalboard([
+            pedalboard.Gain(gain_db=6.0),
+            pedalboard.Distortion(drive_db=12.0),
+            pedalboard.Gain(gain_db=-3.0),
+        ])
+
+        rng = np.random.default_rng(0)
+        block = np.ascontiguousarray(rng.uniform(-0.5, 0.5, (2, 512)).astype(np.float32))
+
+        expected = board.process(block, sample_rate=48000)
+        fused = block.copy()
+        audio_engine_module._apply_stages(fused, audio_engine_module._fused_stages(effects))
+
+        np.testing.assert_allclose(fused, expected, atol=1e-4)
+
+    def test_render_block_without_numba(self):
+        """Test rendering falls back to the pedalboard chain when numba is unavailable"""
+        audio_config = {
+            "input_device": "Scarlett 2i2 USB",
+            "output_device": "BlackHole 2ch",
+            "sample_rate": 48000,
+            "buffer_size": 256,
+            "input_channels": [0],
+            "output_channels": [0, 1]
+        }
+
+        def render(indata):
+            audio_engine = AudioEngine()
+            with patch.object(audio_engine, '_initialize_audio_stream'):
+                audio_engine.start_processing(audio_config)
+            chain = EffectsChain(name="Fused Chain")
+            chain.add_effect(AudioEffect(EffectType.BOOST, {"gain_db": 6.0}))
+            chain.add_effect(AudioEffect(EffectType.DISTORTION, {"drive_db": 12.0}))
+            audio_engine.set_effects_chain(chain)
+
+            audio_engine._rt_sample_rate = 48000.0
+            audio_engine._rt_plan = audio_engine._render_plan
+            outdata = np.empty_like(indata)
+            audio_engine._render_block(indata, outdata, len(indata))
+            return audio_engine, outdata
+
+        rng = np.random.default_rng(1)
+        indata = np.ascontiguousarray(rng.uniform(-0.5, 0.5, (256, 2)).astype(np.float32))
+
+        with patch.object(audio_engine_module, '_apply_stages', None), \
+                patch.object(audio_engine_module, '_mix_gain', None), \
+                patch.object(audio_engine_module, '_mix_planar_gain', None):
+            audio_engine, fallback = render(indata)
+            stages, board = audio_engine._render_plan
+            assert stages is None
+            assert board is audio_engine._pedalboard
+
+        _, default = render(indata)
+        np.testing.assert_allclose(fallback, default, atol=1e-4)
+
+    def test_int16_conversion(self):
+        """Test int16 samples convert to float32 and back, clipping out-of-range floats"""
+        samples = np.array([[-32768, 32767], [0, 1], [-1, 16384]], dtype=np.int16)
+
+        floats = np.empty(samples.shape, dtype=np.float32)
+        audio_engine_module._int16_to_float(samples, floats)
+        assert floats[0, 0] == -1.0
+        assert floats[0, 1] == np.float32(32767 / 32768)
+        assert floats[2, 1] == 0.5
+
+        # Round trip is exact across the full int16 range
+        restored = np.empty_like(samples)
+        audio_engine_module._float_to_int16(floats, restored)
+        np.testing.assert_array_equal(restored, samples)
+
+        # Full-scale and out-of-range floats clip to the int16 limits
+        block = np.array([[1.0, -1.0], [1.5, -1.5], [0.25, -0.25]], dtype=np.float32)
+        out = np.empty(block.shape, dtype=np.int16)
+        audio_engine_module._float_to_int16(block, out)
+        np.testing.assert_array_equal(out, [[32767, -32768], [32767, -32768], [8192, -8192]])
+
     def test_process_audio_frame_invalid_data(self):
         """Test audio frame processing with invalid data"""
         audio_engine = AudioEngine()
@@ -136,6 +353,24 @@ class TestAudioProcessingContract:
         with pytest.raises(ValueError, match="Invalid audio frame data"):
             audio_engine.process_frame(incomplete_frame)
 
+    def test_process_audio_frame_relaxed_validation(self):
+        """Test that disabling strict validation still rejects frames missing fields"""
+        audio_engine = AudioEngine()
+        audio_engine.STRICT_VALIDATION = False
+
+        # Structure is no longer checked
+        mismatched_frame = {
+            "samples": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+            "channels": 2,
+            "sample_rate": 48000
+        }
+        result = audio_engine.process_frame(mismatched_frame)
+        assert result["samples"] == mismatched_frame["samples"]
+
+        # Required fields still are
+        with pytest.raises(ValueError, match="Invalid audio frame data: missing channels"):
+            audio_engine.process_frame({"samples": [[0.1, 0.2]], "sample_rate": 48000})
+
     def test_get_audio_status_contract(self):
         """Test audio status retrieval contract"""
         audio_engine = AudioEngine()
@@ -0,0 +1,58 @@
+import json
+from src.services.config_service import ConfigurationService
+
+
+class TestConfigurationServiceContract:
+    """Contract tests for configuration service interface"""
+
+    def test_set_app_config_clears_recent_presets(self, tmp_path):
+        """Test clearing recent presets right after adding one"""
+        config_service = ConfigurationService(str(tmp_path))
+
+        config_service.add_recent_preset("a", "A")
+        assert [p["id"] for p in config_service.get_recent_presets()] == ["a"]
+
+        config_service.set_app_config({"recent_presets": []})
+        assert config_service.get_recent_presets() == ()
+
+        config_service.close()
+        reloaded = ConfigurationService(str(tmp_path))
+        assert reloaded.get_recent_presets() == ()
+
+    def test_export_config_is_json_serializable(self, tmp_path):
+        """Test exported configuration is made of plain, independent containers"""
+        config_service = ConfigurationService(str(tmp_path))
+        config_service.add_recent_preset("a", "A")
+
+        exported = config_service.export_config()
+        assert set(exported) == {"audio", "ui", "app"}
+        assert json.loads(json.dumps(exported))["app"]["recent_presets"][0]["id"] == "a"
+
+        # Changing the export leaves the service untouched
+        exported["app"]["recent_presets"].clear()
+        exported["audio"]["input_channels"].append(99)
+        assert len(config_service.get_recent_presets()) == 1
+        assert 99 not in config_service.get_audio_config()["input_channels"]
+
+    def test_recent_preset_timestamps(self, tmp_path):
+        """Test recent presets persist integer timestamps and still read older ISO entries"""
+        (tmp_path / "app_config.json").write_text(json.dumps({
+            "recent_presets": [
+                {"id": "old", "name": "Old", "timestamp": "2025-01-02T03:04:05.123456"}
+            ]
+        }))
+        config_service = ConfigurationService(str(tmp_path))
+        config_service.add_recent_preset("new", "New")
+
+        recent = config_service.get_recent_presets()
+        assert [p["id"] for p in recent] == ["new", "old"]
+        assert recent[1]["timestamp"] == "2025-01-02T03:04:05.123456"
+        assert isinstance(recent[0]["timestamp"], str)
+        assert config_service.export_config()["app"]["recent_presets"][1]["timestamp"] == recent[1]["timestamp"]
+
+        config_service.close()
+        stored = json.loads((tmp_path / "app_config.json").read_text())["recent_presets"]
+        assert all(isinstance(p["timestamp"], int) for p in stored)
+
+        reloaded = ConfigurationService(str(tmp_path))
+        assert reloaded.get_recent_presets() == recent
@@ -59,6 +59,27 @@ class TestPresetManagementContract:
             desc_match = preset["description"] and "rock" in preset["description"].lower()
             assert name_match or desc_match
 
+    def test_list_presets_reflects_preset_updates(self):
+        """Test that summaries follow direct preset updates and are not shared"""
+        preset_manager = PresetManager()
+        saved_preset = preset_manager.save_preset({
+            "name": "Summary Test",
+            "effects_chain_config": {"name": "Test", "effects": []},
+            "tags": []
+        })
+        preset_manager.list_presets()
+
+        preset_manager.get_preset(saved_preset.id).update(description="new", tags=["x"])
+        summary = next(p for p in preset_manager.list_presets() if p["name"] == "Summary Test")
+        assert summary["description"] == "new"
+        assert summary["tags"] == ["x"]
+
+        summary["tags"].append("junk")
+        summary["description"] = "changed"
+        summary = next(p for p in preset_manager.list_presets() if p["name"] == "Summary Test")
+        assert summary["tags"] == ["x"]
+        assert summary["description"] == "new"
+
     def test_save_new_preset_contract(self):
         """Test saving new preset contract"""
         preset_manager = PresetManager()
@@ -139,6 +160,23 @@ class TestPresetManagementContract:
         with pytest.raises(ValueError, match="Preset name already exists"):
             preset_manager.save_preset(preset_config)
 
+    def test_save_preset_duplicate_name_ignores_case(self):
+        """Test that preset names differing only in case count as duplicates"""
+        preset_manager = PresetManager()
+
+        preset_manager.save_preset({
+            "name": "Case Test Preset",
+            "effects_chain_config": {"name": "Test", "effects": []},
+            "tags": []
+        })
+
+        with pytest.raises(ValueError, match="Preset name already exists"):
+            preset_manager.save_preset({
+                "name": "CASE test preset",
+                "effects_chain_config": {"name": "Test", "effects": []},
+                "tags": []
+            })
+
     def test_get_preset_details_contract(self):
         """Test getting preset details contract"""
         preset_manager = PresetManager()
@@ -331,6 +369,22 @@ class TestPresetManagementContract:
         with pytest.raises(ValueError, match="Preset not found"):
             preset_manager.load_preset(nonexistent_id)
 
+    def test_load_preset_invalid_parameters(self):
+        """Test loading a preset whose effects cannot be built"""
+        preset_manager = PresetManager()
+
+        saved_preset = preset_manager.save_preset({
+            "name": "Invalid Load Test",
+            "effects_chain_config": {
+                "name": "Invalid Chain",
+                "effects": [{"type": "REVERB", "parameters": {"room_size": 2.0}}]
+            },
+            "tags": []
+        })
+
+        with pytest.raises(RuntimeError, match="Failed to load preset: room_size must be between 0.0 and 1.0"):
+            preset_manager.load_preset(saved_preset.id)
+
     def test_export_presets_contract(self):
         """Test exporting presets contract"""
         preset_manager = PresetManager()
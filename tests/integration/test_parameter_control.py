@@ -398,4 +398,28 @@ class TestParameterControlIntegration:
         effects_manager.update_effect_parameters(boost_effect.id, {"tone": 0.25})
 
         updated_params = effects_manager.get_effect_parameters(boost_effect.id)
-        assert updated_params["tone"]["value"] == 0.25
\ No newline at end of file
+        assert updated_params["tone"]["value"] == 0.25
+
+    def test_parameter_update_keeps_unchanged_plugins(self):
+        """Test that rebuilding the chain only recreates effects whose parameters changed"""
+        audio_engine = AudioEngine()
+        effects_manager = EffectsManager()
+
+        chain_config = {
+            "name": "Plugin Reuse Test",
+            "effects": [
+                {"type": "BOOST", "parameters": {"gain_db": 0.0}},
+                {"type": "DELAY", "parameters": {"delay_seconds": 0.25}}
+            ]
+        }
+
+        effects_chain = effects_manager.create_chain(chain_config)
+        audio_engine.set_effects_chain(effects_chain)
+        boost_plugin, delay_plugin = list(audio_engine._pedalboard)
+
+        effects_chain.effects[0].update_parameters({"gain_db": 6.0})
+        audio_engine.set_effects_chain(effects_chain)
+        new_boost_plugin, new_delay_plugin = list(audio_engine._pedalboard)
+
+        assert new_boost_plugin is not boost_plugin
+        assert new_delay_plugin is delay_plugin
@@ -170,4 +170,69 @@ class TestAudioEffect:
     def test_invalid_effect_type(self):
         """Test that invalid effect types raise an error"""
         with pytest.raises(ValueError, match="Invalid effect type"):
-            AudioEffect(effect_type="INVALID_TYPE")
\ No newline at end of file
+            AudioEffect(effect_type="INVALID_TYPE")
+
+    def test_parameter_info(self):
+        """Test parameter metadata reflects current value and static ranges"""
+        effect = AudioEffect(effect_type=EffectType.DELAY, parameters={"feedback": 0.6})
+
+        info = effect.get_parameter_info("feedback")
+        assert info == {
+            "value": 0.6,
+            "min_value": 0.0,
+            "max_value": 0.95,
+            "default_value": 0.3,
+            "units": "",
+            "curve_type": "linear"
+        }
+
+        # Returned info is a fresh dict per call
+        info["value"] = 0.9
+        assert effect.get_parameter_info("feedback")["value"] == 0.6
+
+        all_info = effect.get_all_parameter_info()
+        assert list(all_info.keys()) == ["delay_seconds", "feedback", "mix", "tempo_sync"]
+        assert all_info["tempo_sync"]["units"] == "bool"
+
+    def test_copy_effect(self):
+        """Test copying an effect keeps its state but not its ID"""
+        effect = AudioEffect(effect_type=EffectType.BOOST, parameters={"gain_db": 6.0})
+        effect.set_bypassed(True)
+        effect.set_preset_name("Solo Boost")
+
+        effect_copy = effect.copy()
+
+        assert effect_copy.id != effect.id
+        assert effect_copy.type == EffectType.BOOST
+        assert effect_copy.bypassed
+        assert effect_copy.preset_name == "Solo Boost"
+        assert effect_copy.parameters == effect.parameters
+
+        # Parameters are not shared with the original
+        effect_copy.update_parameters({"gain_db": 12.0})
+        assert effect.parameters["gain_db"] == 6.0
+
+    def test_rejected_update_leaves_parameters_unchanged(self):
+        """Test a partially invalid update does not apply any values"""
+        effect = AudioEffect(effect_type=EffectType.REVERB)
+
+        with pytest.raises(ValueError, match="damping must be between 0.0 and 1.0"):
+            effect.update_parameters({"room_size": 0.9, "damping": 1.5})
+
+        assert effect.parameters["room_size"] == 0.5
+        assert effect.parameters["damping"] == 0.5
+
+        with pytest.raises(ValueError, match="wet_level must be between 0.0 and 1.0"):
+            effect.update_parameters({"wet_level": float("nan")})
+
+    def test_parameter_keys_are_schema_names(self):
+        """Test updates with equal but distinct key strings keep the schema keys"""
+        effect = AudioEffect(effect_type=EffectType.BOOST)
+        schema_key = next(iter(effect.parameters))
+
+        runtime_key = "".join(["gain", "_db"])
+        assert runtime_key is not schema_key
+        effect.update_parameters({runtime_key: 3.0})
+
+        assert next(iter(effect.parameters)) is schema_key
+        assert effect.parameters["gain_db"] == 3.0
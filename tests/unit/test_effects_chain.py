@@ -37,6 +37,57 @@ class TestEffectsChain:
 
         assert len(chain.effects) == 0
 
+    def test_get_effect_by_id(self):
+        """Test effect lookup by ID stays in sync with chain mutations"""
+        chain = EffectsChain(name="Test Chain")
+        boost = AudioEffect(effect_type=EffectType.BOOST)
+        delay = AudioEffect(effect_type=EffectType.DELAY)
+
+        chain.add_effect(boost)
+        chain.add_effect(delay)
+        assert chain.get_effect_by_id(delay.id) is delay
+
+        assert chain.remove_effect(boost.id)
+        assert chain.get_effect_by_id(boost.id) is None
+        assert not chain.remove_effect(boost.id)
+        assert delay.position == 0
+
+        restored = EffectsChain.from_dict(chain.to_dict())
+        assert restored.get_effect_by_id(delay.id) == delay
+
+        chain.clear_effects()
+        assert chain.get_effect_by_id(delay.id) is None
+
+    def test_trusted_round_trip(self):
+        """Test trusted from_dict restores effects from to_dict output"""
+        chain = EffectsChain(name="Test Chain")
+        delay = AudioEffect(effect_type=EffectType.DELAY, parameters={"mix": 0.6})
+        delay.set_bypassed(True)
+        chain.add_effect(AudioEffect(effect_type=EffectType.BOOST))
+        chain.add_effect(delay)
+
+        restored = EffectsChain.from_dict(chain.to_dict(), trusted=True)
+
+        restored_delay = restored.get_effect_by_id(delay.id)
+        assert restored_delay.type == EffectType.DELAY
+        assert restored_delay.parameters == delay.parameters
+        assert restored_delay.bypassed
+        assert restored_delay.position == 1
+
+    def test_trusted_round_trip_drops_unknown_parameters(self):
+        """Test trusted from_dict keeps only the effect type's schema parameters"""
+        chain = EffectsChain(name="Test Chain")
+        chain.add_effect(AudioEffect(effect_type=EffectType.BOOST, parameters={"gain_db": 6.0}))
+        data = chain.to_dict()
+        data["effects"][0]["parameters"]["unknown"] = 1.0
+
+        restored = EffectsChain.from_dict(data, trusted=True)
+
+        boost = restored.effects[0]
+        assert "unknown" not in boost.parameters
+        assert list(boost.parameters) == list(AudioEffect.PARAMETER_DEFINITIONS[EffectType.BOOST])
+        assert boost.parameters["gain_db"] == 6.0
+
     def test_reorder_effects_in_chain(self):
         """Test reordering effects in the chain"""
         chain = EffectsChain(name="Test Chain")
@@ -58,6 +109,86 @@ class TestEffectsChain:
         assert distortion.position == 0
         assert boost.position == 1
 
+    def test_reorder_effects_validation(self):
+        """Test reorder rejects unknown and duplicated effect IDs"""
+        chain = EffectsChain(name="Test Chain")
+        boost = AudioEffect(effect_type=EffectType.BOOST)
+        distortion = AudioEffect(effect_type=EffectType.DISTORTION)
+
+        chain.add_effect(boost)
+        chain.add_effect(distortion)
+
+        unknown = AudioEffect(effect_type=EffectType.DELAY)
+        with pytest.raises(ValueError, match=f"Effect ID {unknown.id} not found in chain"):
+            chain.reorder_effects([boost.id, unknown.id])
+
+        with pytest.raises(ValueError, match="Effect ID list must contain all current effects"):
+            chain.reorder_effects([boost.id, boost.id])
+
+        # Failed reorders leave the chain untouched
+        assert chain.effects == [boost, distortion]
+
+    def test_modified_time_tracks_mutations(self):
+        """Test modified time advances on mutation and survives serialization"""
+        chain = EffectsChain(name="Test Chain")
+        assert chain.modified_at == chain.created_at
+
+        chain.add_effect(AudioEffect(effect_type=EffectType.BOOST))
+        assert chain.modified_at >= chain.created_at
+
+        restored = EffectsChain.from_dict(chain.to_dict())
+        assert restored.created_at == chain.created_at
+        assert restored.modified_at == chain.modified_at
+
+    def test_active_count_and_effect_types(self):
+        """Test chain summary follows membership and bypass changes"""
+        chain = EffectsChain(name="Test Chain")
+        boost = AudioEffect(effect_type=EffectType.BOOST)
+        reverb = AudioEffect(effect_type=EffectType.REVERB)
+
+        chain.add_effect(boost)
+        chain.add_effect(reverb)
+        assert chain.get_active_effects_count() == 2
+        assert chain.has_effect_type(EffectType.REVERB)
+        assert not chain.has_effect_type(EffectType.DELAY)
+
+        reverb.set_bypassed(True)
+        assert chain.get_active_effects_count() == 1
+
+        # Direct assignment is picked up too
+        boost.bypassed = True
+        assert chain.get_active_effects_count() == 0
+        boost.bypassed = False
+
+        chain.remove_effect(reverb.id)
+        assert chain.get_active_effects_count() == 1
+        assert not chain.has_effect_type(EffectType.REVERB)
+
+    def test_version_tracks_own_effects_only(self):
+        """Test the chain version changes with its own effects' bypass state"""
+        chain = EffectsChain(name="Chain A")
+        other = EffectsChain(name="Chain B")
+        boost = AudioEffect(effect_type=EffectType.BOOST)
+        delay = AudioEffect(effect_type=EffectType.DELAY)
+        chain.add_effect(boost)
+        other.add_effect(delay)
+
+        version, other_version = chain.version, other.version
+        boost.bypassed = True
+        assert chain.version != version
+        assert other.version == other_version
+
+        # Setting the same state again is not a change
+        version = chain.version
+        boost.set_bypassed(True)
+        assert chain.version == version
+
+        # Removed effects no longer affect the chain
+        chain.remove_effect(boost.id)
+        version = chain.version
+        boost.bypassed = False
+        assert chain.version == version
+
     def test_chain_name_validation(self):
         """Test effects chain name validation"""
         # Valid name
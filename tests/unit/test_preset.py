@@ -99,6 +99,13 @@ class TestPreset:
                 tags=["invalid@tag"]
             )
 
+        with pytest.raises(ValueError, match="Tags must be alphanumeric with hyphens/underscores only"):
+            Preset.from_effects_chain(
+                chain,
+                name="Test Preset",
+                tags=["trailing-newline\n"]
+            )
+
     def test_save_and_load_preset(self):
         """Test saving and loading preset to/from JSON"""
         # Create complex effects chain
@@ -184,6 +191,36 @@ class TestPreset:
         assert restored_distortion.type == EffectType.DISTORTION
         assert restored_distortion.parameters["drive_db"] == 25.0
 
+    def test_restored_chain_builds_effects_lazily(self):
+        """Test effects are only built when the restored chain is accessed"""
+        preset = Preset(
+            name="Lazy Restore",
+            effects_chain_config={
+                "effects": [
+                    {"type": "DELAY", "parameters": {"feedback": 0.5}, "bypassed": True},
+                    {"type": "REVERB", "parameters": {"room_size": 2.0}}
+                ]
+            }
+        )
+
+        restored_chain = preset.to_effects_chain()
+        assert len(restored_chain) == 2
+
+        # Invalid parameters surface when the effects are built
+        with pytest.raises(ValueError, match="room_size must be between 0.0 and 1.0"):
+            restored_chain.materialize()
+
+        preset.effects_chain_config["effects"].pop()
+        restored_chain = preset.to_effects_chain()
+        effects = restored_chain.materialize()
+        assert effects == restored_chain.effects
+        assert len(effects) == 1
+        delay = restored_chain[0]
+        assert delay.type == EffectType.DELAY
+        assert delay.parameters["feedback"] == 0.5
+        assert delay.bypassed
+        assert delay.position == 0
+
     def test_preset_unique_name_requirement(self):
         """Test that preset names should be unique (business rule)"""
         # This test documents the requirement - actual uniqueness
@@ -212,4 +249,16 @@ class TestPreset:
             name="Custom Version",
             version="2.1.0"
         )
-        assert preset_custom.version == "2.1.0"
\ No newline at end of file
+        assert preset_custom.version == "2.1.0"
+
+    def test_update_advances_version_sequence(self):
+        """Test that every update is ordered even within one clock tick"""
+        chain = EffectsChain(name="Sequence Test")
+        preset = Preset.from_effects_chain(chain, name="Sequence Test")
+
+        before = preset._version_seq
+        preset.update(description="first")
+        first = preset._version_seq
+        preset.update(description="second")
+
+        assert before < first < preset._version_seq
@@ -0,0 +1,41 @@
+import numpy as np
+from src.services._ring import FrameRing
+
+
+class TestFrameRing:
+    def test_capacity_rounds_up_to_power_of_two(self):
+        """Test that ring capacity is the next power of two"""
+        assert FrameRing(100, 2).capacity == 128
+        assert FrameRing(256, 2).capacity == 256
+
+    def test_round_trip_across_wraparound(self):
+        """Test that blocks come back unchanged when they wrap the end of the ring"""
+        ring = FrameRing(64, 2)
+        out = np.empty((24, 2), dtype=np.float32)
+
+        for i in range(10):
+            block = np.full((24, 2), i, dtype=np.float32)
+            assert ring.write(block)
+            assert ring.read_into(out)
+            np.testing.assert_array_equal(out, block)
+
+        assert ring.available() == 0
+
+    def test_overrun_and_underrun_are_rejected(self):
+        """Test that writes past capacity and reads past available data fail"""
+        ring = FrameRing(32, 2)
+        out = np.empty((16, 2), dtype=np.float32)
+
+        assert not ring.read_into(out)
+        assert ring.write(np.ones((32, 2), dtype=np.float32))
+        assert not ring.write(np.ones((1, 2), dtype=np.float32))
+        assert ring.space() == 0
+
+    def test_fill_silence(self):
+        """Test pre-filling the ring with silence"""
+        ring = FrameRing(32, 2)
+        ring.fill_silence(8)
+
+        out = np.ones((8, 2), dtype=np.float32)
+        assert ring.read_into(out)
+        assert not out.any()